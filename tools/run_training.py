@@ -27,8 +27,8 @@ def run_episode(sim_time=120.0, warmup=10.0, arrival_rate=0.4, seed=None, schedu
     sim.run(until_time=sim_time, warmup=warmup)
     # métricas agregadas desde jobs_completed
     if sim.jobs_completed:
-        makespans = [j['makespan'] for j in sim.jobs_completed.values()]
-        tardiness = [j['tardiness'] for j in sim.jobs_completed.values()]
+        makespans = [j.makespan for j in sim.jobs_completed.values()]
+        tardiness = [j.tardiness for j in sim.jobs_completed.values()]
         makespan_promedio = sum(makespans) / len(makespans) if makespans else 0.0
         tardanza_total = sum(tardiness)
         trabajos_atrasados = len([t for t in tardiness if t > 0])
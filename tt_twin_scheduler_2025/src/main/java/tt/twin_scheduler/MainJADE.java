@@ -83,6 +83,8 @@ public class MainJADE {
                     handleFeedback(req, resp);
                 } else if ("event".equals(type)) {
                     handleEvent(req, resp);
+                } else if ("event_batch".equals(type)) {
+                    handleEventBatch(req, resp);
                 } else {
                     resp.addProperty("error", "Unknown request type: " + type);
                 }
@@ -148,6 +150,18 @@ public class MainJADE {
         resp.addProperty("ok", true);
     }
 
+    private static void handleEventBatch(JsonObject req, JsonObject resp) {
+        int count = 0;
+        if (req.has("events") && req.get("events").isJsonArray()) {
+            for (JsonElement el : req.getAsJsonArray("events")) {
+                handleEvent(el.getAsJsonObject(), resp);
+                count++;
+            }
+        }
+        resp.addProperty("status", "ok");
+        resp.addProperty("count", count);
+    }
+
     private static void handleEvent(JsonObject req, JsonObject resp) {
         String eventType = req.has("event_type") ? req.get("event_type").getAsString() : "unknown";
         // System.out.println("[JADE MIRROR] Event Received: " + eventType + " | Payload: " + req.toString());
@@ -176,6 +176,9 @@ public class MainJADEPhase3 {
                 case "operation_complete":
                     return handleOperationComplete(req);
                     
+                case "notification_batch":
+                    return handleNotificationBatch(req);
+                    
                 case "operation_failure":
                     return handleOperationFailure(req);
                     
@@ -289,6 +292,23 @@ public class MainJADEPhase3 {
         }
     }
     
+    /**
+     * Procesa un lote de notificaciones fire-and-forget enviadas por SimPy
+     */
+    private static String handleNotificationBatch(JsonObject req) {
+        int count = 0;
+        if (req.has("notifications") && req.get("notifications").isJsonArray()) {
+            for (JsonElement elem : req.getAsJsonArray("notifications")) {
+                processRequest(elem.toString());
+                count++;
+            }
+        }
+        JsonObject response = new JsonObject();
+        response.addProperty("status", "success");
+        response.addProperty("count", count);
+        return gson.toJson(response);
+    }
+    
     /**
      * Notifica inicio de operación
      */
@@ -15,7 +15,7 @@ __version__ = "1.0.0"
 __author__ = "JOVILCHESC"
 __description__ = "Job Shop Scheduler Simulator - Static Environment"
 
-from .metrics import MetricsCalculator
+from .metrics import MetricsCalculator, EventBuffer
 from .scheduling_rules import SchedulingRules
 from .datasets import Datasets
 from .simulator_static import (
@@ -24,6 +24,7 @@ from .simulator_static import (
 
 __all__ = [
     "MetricsCalculator",
+    "EventBuffer",
     "SchedulingRules",
     "Datasets",
     "Machine",
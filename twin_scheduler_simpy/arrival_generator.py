@@ -14,16 +14,19 @@ Características:
 import simpy
 import random
 import numpy as np
-from typing import List, Tuple, Dict, Callable
+from typing import List, Tuple, Dict, Callable, Optional
 from dataclasses import dataclass
 
+# Tamaño de los bloques de muestras aleatorias pre-generadas
+RNG_BLOCK_SIZE = 4096
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class JobSpec:
-    """Especificación de un trabajo generado dinámicamente."""
+    """Especificación (inmutable) de un trabajo generado dinámicamente."""
     job_id: int
     arrival_time: float
-    operations: List[Tuple[int, int]]  # [(machine_id, duration), ...]
+    operations: Tuple[Tuple[int, int], ...]  # ((machine_id, duration), ...)
     due_date: float = None
 
 
@@ -37,7 +40,8 @@ class ArrivalGenerator:
                  max_operations: int = 6,
                  min_duration: int = 1,
                  max_duration: int = 10,
-                 due_date_multiplier: float = 1.5):
+                 due_date_multiplier: float = 1.5,
+                 rng: Optional[np.random.Generator] = None):
         """
         Args:
             env: Entorno SimPy
@@ -48,6 +52,8 @@ class ArrivalGenerator:
             min_duration: Duración mínima de una operación
             max_duration: Duración máxima de una operación
             due_date_multiplier: Multiplicador para fecha de entrega (vs makespan estimado)
+            rng: Generador NumPy propio; si es None se usan los RNG globales
+                de numpy y random
         """
         self.env = env
         self.arrival_rate = arrival_rate
@@ -57,15 +63,32 @@ class ArrivalGenerator:
         self.min_duration = min_duration
         self.max_duration = max_duration
         self.due_date_multiplier = due_date_multiplier
+        self.rng = rng
         
         self.job_counter = 0
         self.jobs_generated = []
         self.arrival_callback = None  # Callback para notificar nuevas llegadas
+        
+        # Inter-arrival times pre-muestreados en bloque (se rellena al agotarse)
+        self._iat_buffer: List[float] = []
+        self._iat_idx = 0
     
     def set_arrival_callback(self, callback: Callable[[JobSpec], None]):
         """Registra callback para ser llamado cuando llega una orden."""
         self.arrival_callback = callback
     
+    def next_inter_arrival(self) -> float:
+        """Siguiente inter-arrival time exponencial del bloque pre-muestreado."""
+        if self._iat_idx >= len(self._iat_buffer):
+            rng = self.rng if self.rng is not None else np.random
+            self._iat_buffer = rng.exponential(
+                1.0 / self.arrival_rate, size=RNG_BLOCK_SIZE
+            ).tolist()
+            self._iat_idx = 0
+        inter_arrival_time = self._iat_buffer[self._iat_idx]
+        self._iat_idx += 1
+        return inter_arrival_time
+    
     def generate_job_operations(self) -> List[Tuple[int, int]]:
         """
         Genera una secuencia aleatoria de operaciones.
@@ -73,6 +96,15 @@ class ArrivalGenerator:
         Returns:
             Lista de (machine_id, duration)
         """
+        rng = self.rng
+        if rng is not None:
+            num_ops = int(rng.integers(self.min_operations, self.max_operations + 1))
+            machines = rng.choice(self.num_machines, size=min(num_ops, self.num_machines),
+                                  replace=False).tolist()
+            durations = rng.integers(self.min_duration, self.max_duration + 1,
+                                     size=len(machines)).tolist()
+            return list(zip(machines, durations))
+        
         num_ops = random.randint(self.min_operations, self.max_operations)
         machines = random.sample(range(self.num_machines), min(num_ops, self.num_machines))
         
@@ -103,7 +135,7 @@ class ArrivalGenerator:
         """
         while True:
             # Tiempo hasta próxima llegada: distribución exponencial
-            inter_arrival_time = np.random.exponential(1.0 / self.arrival_rate)
+            inter_arrival_time = self.next_inter_arrival()
             yield self.env.timeout(inter_arrival_time)
             
             # Crear nuevo trabajo
@@ -115,7 +147,7 @@ class ArrivalGenerator:
             job = JobSpec(
                 job_id=self.job_counter,
                 arrival_time=arrival_time,
-                operations=operations,
+                operations=tuple(operations),
                 due_date=due_date
             )
             
@@ -137,6 +169,8 @@ class ArrivalGenerator:
         """Resetea el generador de llegadas."""
         self.job_counter = 0
         self.jobs_generated = []
+        self._iat_buffer = []
+        self._iat_idx = 0
 
 
 # ============================================================================
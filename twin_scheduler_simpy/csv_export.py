@@ -0,0 +1,27 @@
+"""
+Escritura de tablas columnares a CSV.
+
+Construye el DataFrame directamente desde los arrays NumPy (sin listas de
+filas intermedias) y escribe siempre con pandas, de modo que el formato de
+salida (comillas, representación de floats) es el mismo en todo entorno.
+"""
+
+from typing import Dict, Union
+
+import numpy as np
+
+
+def write_csv(columns: Union[Dict[str, np.ndarray], np.ndarray], path: str):
+    """
+    Escribe una tabla a CSV (con encabezado, sin índice).
+
+    Args:
+        columns: Diccionario {nombre: array} o array estructurado NumPy
+        path: Ruta del archivo
+    """
+    import pandas as pd
+
+    if isinstance(columns, np.ndarray):
+        columns = {name: columns[name] for name in columns.dtype.names}
+
+    pd.DataFrame(columns).to_csv(path, index=False)
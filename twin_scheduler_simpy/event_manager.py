@@ -16,11 +16,13 @@ Características:
 
 import csv
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from enum import Enum
 
+import numpy as np
+
 
 class EventType(Enum):
     """Tipos de eventos en la simulación."""
@@ -53,6 +55,50 @@ class SimulationEvent:
         return data
 
 
+# ============================================================================
+# ALMACENAMIENTO COLUMNAR DE EVENTOS
+# ============================================================================
+# Cada evento ocupa una fila de un array estructurado (un campo por columna).
+# Los valores ausentes se codifican como -1 (enteros) o NaN (flotantes).
+
+EVENT_DTYPE = np.dtype([
+    ('time', 'f8'),
+    ('type', 'i1'),          # índice en EventManager.type_names
+    ('job_id', 'i4'),
+    ('machine_id', 'i2'),
+    ('duration', 'f8'),
+    ('queue_length', 'i4'),
+    ('info_key', 'i1'),      # índice en INFO_KEYS; -1 sin info, -2 info en diccionario aparte
+    ('info', 'f8'),
+])
+
+# Claves numéricas de additional_info que se guardan en las columnas info_key/info
+INFO_KEYS = ['num_operations', 'repair_duration', 'makespan', 'tardiness']
+_INFO_KEY_CODE = {key: code for code, key in enumerate(INFO_KEYS)}
+_INT_INFO_KEYS = {'num_operations'}
+
+NO_INFO = -1
+EXTRA_INFO = -2
+
+_TYPE_NAMES = [event_type.value for event_type in EventType]
+_ARRIVAL = _TYPE_NAMES.index(EventType.ARRIVAL.value)
+_START = _TYPE_NAMES.index(EventType.START.value)
+_END = _TYPE_NAMES.index(EventType.END.value)
+_FAILURE = _TYPE_NAMES.index(EventType.FAILURE.value)
+_REPAIR_START = _TYPE_NAMES.index(EventType.REPAIR_START.value)
+_REPAIR_END = _TYPE_NAMES.index(EventType.REPAIR_END.value)
+_COMPLETE = _TYPE_NAMES.index(EventType.COMPLETE.value)
+_NUM_OPERATIONS = _INFO_KEY_CODE['num_operations']
+_REPAIR_DURATION = _INFO_KEY_CODE['repair_duration']
+_MAKESPAN = _INFO_KEY_CODE['makespan']
+_TARDINESS = _INFO_KEY_CODE['tardiness']
+
+NAN = float('nan')
+
+# Filas pendientes que se acumulan como tuplas antes de volcarlas al array
+_PENDING_ROWS = 1 << 14
+
+
 class EventManager:
     """Gestor centralizado de eventos de simulación."""
     
@@ -61,7 +107,6 @@ class EventManager:
         Args:
             output_dir: Directorio para guardar logs
         """
-        self.events: List[SimulationEvent] = []
         self.output_dir = output_dir
         self.start_time = None
         self.end_time = None
@@ -69,95 +114,157 @@ class EventManager:
         # Crear directorio si no existe
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
+        
+        self._init_storage()
+    
+    def _init_storage(self):
+        """Inicializa el almacenamiento columnar vacío."""
+        self.type_names: List[str] = list(_TYPE_NAMES)
+        self._type_codes: Dict[str, int] = {name: code for code, name in enumerate(self.type_names)}
+        self._table = np.empty(1 << 12, dtype=EVENT_DTYPE)
+        self._size = 0
+        self._rows: List[tuple] = []
+        self._extra_info: Dict[int, Dict] = {}
+    
+    def _flush_rows(self):
+        """Vuelca las filas pendientes al array, duplicando su capacidad si hace falta."""
+        if not self._rows:
+            return
+        n = len(self._rows)
+        needed = self._size + n
+        if needed > len(self._table):
+            capacity = len(self._table)
+            while capacity < needed:
+                capacity *= 2
+            table = np.empty(capacity, dtype=EVENT_DTYPE)
+            table[:self._size] = self._table[:self._size]
+            self._table = table
+        self._table[self._size:needed] = np.array(self._rows, dtype=EVENT_DTYPE)
+        self._size = needed
+        self._rows = []
+    
+    def log_primitive(self, time: float, type_code: int, job_id: int = -1,
+                      machine_id: int = -1, duration: float = NAN,
+                      queue_length: int = -1, info_key: int = NO_INFO, info: float = NAN):
+        """Registra un evento ya codificado (ver EVENT_DTYPE) sin crear objetos."""
+        rows = self._rows
+        rows.append((time, type_code, job_id, machine_id, duration, queue_length, info_key, info))
+        if len(rows) >= _PENDING_ROWS:
+            self._flush_rows()
+    
+    @property
+    def table(self) -> np.ndarray:
+        """Vista del array estructurado con todos los eventos registrados."""
+        self._flush_rows()
+        return self._table[:self._size]
+    
+    @property
+    def num_events(self) -> int:
+        """Número de eventos registrados."""
+        return self._size + len(self._rows)
+    
+    @property
+    def events(self) -> List[SimulationEvent]:
+        """Eventos registrados como objetos SimulationEvent (se reconstruyen)."""
+        table = self.table
+        return [self._to_event(i, row) for i, row in enumerate(table.tolist())]
+    
+    def _to_event(self, index: int, row: tuple) -> SimulationEvent:
+        time, type_code, job_id, machine_id, duration, queue_length, info_key, info = row
+        if info_key == NO_INFO:
+            additional_info = None
+        elif info_key == EXTRA_INFO:
+            additional_info = self._extra_info[index]
+        else:
+            key = INFO_KEYS[info_key]
+            additional_info = {key: int(info) if key in _INT_INFO_KEYS else info}
+        return SimulationEvent(
+            time=time,
+            event_type=self.type_names[type_code],
+            job_id=None if job_id == -1 else job_id,
+            machine_id=None if machine_id == -1 else machine_id,
+            duration=None if duration != duration else duration,
+            queue_length=None if queue_length == -1 else queue_length,
+            additional_info=additional_info
+        )
+    
+    def _type_code(self, event_type: str) -> int:
+        code = self._type_codes.get(event_type)
+        if code is None:
+            code = self._type_codes[event_type] = len(self.type_names)
+            self.type_names.append(event_type)
+        return code
     
     def log_event(self, event: SimulationEvent):
         """Registra un evento."""
-        self.events.append(event)
+        info_key, info = NO_INFO, NAN
+        extra = event.additional_info
+        if extra:
+            key, value = next(iter(extra.items()))
+            if len(extra) == 1 and key in _INFO_KEY_CODE and isinstance(value, (int, float)):
+                info_key, info = _INFO_KEY_CODE[key], value
+            else:
+                info_key = EXTRA_INFO
+                self._extra_info[self.num_events] = extra
+        
+        self.log_primitive(
+            event.time,
+            self._type_code(event.event_type),
+            -1 if event.job_id is None else event.job_id,
+            -1 if event.machine_id is None else event.machine_id,
+            NAN if event.duration is None else event.duration,
+            -1 if event.queue_length is None else event.queue_length,
+            info_key,
+            info
+        )
     
     def arrival_event(self, time: float, job_id: int, num_operations: int):
         """Registra llegada de orden."""
-        event = SimulationEvent(
-            time=time,
-            event_type=EventType.ARRIVAL.value,
-            job_id=job_id,
-            additional_info={"num_operations": num_operations}
-        )
-        self.log_event(event)
+        self.log_primitive(time, _ARRIVAL, job_id, info_key=_NUM_OPERATIONS, info=num_operations)
     
     def operation_start(self, time: float, job_id: int, machine_id: int, 
                        duration: float, queue_length: int = 0):
         """Registra inicio de operación."""
-        event = SimulationEvent(
-            time=time,
-            event_type=EventType.START.value,
-            job_id=job_id,
-            machine_id=machine_id,
-            duration=duration,
-            queue_length=queue_length
-        )
-        self.log_event(event)
+        self.log_primitive(time, _START, job_id, machine_id, duration, queue_length)
     
     def operation_end(self, time: float, job_id: int, machine_id: int):
         """Registra fin de operación."""
-        event = SimulationEvent(
-            time=time,
-            event_type=EventType.END.value,
-            job_id=job_id,
-            machine_id=machine_id
-        )
-        self.log_event(event)
+        self.log_primitive(time, _END, job_id, machine_id)
     
     def machine_failure(self, time: float, machine_id: int, repair_duration: float):
         """Registra fallo de máquina."""
-        event = SimulationEvent(
-            time=time,
-            event_type=EventType.FAILURE.value,
-            machine_id=machine_id,
-            additional_info={"repair_duration": repair_duration}
-        )
-        self.log_event(event)
+        self.log_primitive(time, _FAILURE, -1, machine_id,
+                           info_key=_REPAIR_DURATION, info=repair_duration)
     
     def repair_start(self, time: float, machine_id: int, repair_duration: float):
         """Registra inicio de reparación."""
-        event = SimulationEvent(
-            time=time,
-            event_type=EventType.REPAIR_START.value,
-            machine_id=machine_id,
-            duration=repair_duration
-        )
-        self.log_event(event)
+        self.log_primitive(time, _REPAIR_START, -1, machine_id, repair_duration)
     
     def repair_end(self, time: float, machine_id: int, total_downtime: float):
         """Registra fin de reparación."""
-        event = SimulationEvent(
-            time=time,
-            event_type=EventType.REPAIR_END.value,
-            machine_id=machine_id,
-            duration=total_downtime
-        )
-        self.log_event(event)
+        self.log_primitive(time, _REPAIR_END, -1, machine_id, total_downtime)
     
     def job_complete(self, time: float, job_id: int, makespan: float):
         """Registra completación de trabajo."""
-        event = SimulationEvent(
-            time=time,
-            event_type=EventType.COMPLETE.value,
-            job_id=job_id,
-            additional_info={"makespan": makespan}
-        )
-        self.log_event(event)
+        self.log_primitive(time, _COMPLETE, job_id, info_key=_MAKESPAN, info=makespan)
+    
+    def job_complete_tardiness(self, time: float, job_id: int, tardiness: float):
+        """Registra completación de trabajo con su tardanza (Fase 3)."""
+        self.log_primitive(time, _COMPLETE, job_id, info_key=_TARDINESS, info=tardiness)
     
-    def export_to_csv(self, filename: str = "simulation_log"):
+    def export_to_csv(self, filename: str = "simulation_log", timestamp: Optional[str] = None):
         """
         Exporta eventos a archivo CSV.
         
         Args:
             filename: Nombre del archivo (sin extensión)
+            timestamp: Marca de tiempo para el nombre (por defecto, la actual)
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filepath = os.path.join(self.output_dir, f"{filename}_{timestamp}.csv")
         
-        if not self.events:
+        if not self.num_events:
             print(f"[WARNING] No hay eventos para exportar")
             return filepath
         
@@ -178,17 +285,21 @@ class EventManager:
     
     def get_event_summary(self) -> Dict[str, Any]:
         """Retorna resumen de eventos."""
-        event_counts = {}
-        for event in self.events:
-            event_type = event.event_type
-            event_counts[event_type] = event_counts.get(event_type, 0) + 1
+        table = self.table
+        counts = np.bincount(table['type'], minlength=len(self.type_names))
+        event_counts = {
+            self.type_names[code]: int(count) for code, count in enumerate(counts) if count
+        }
         
+        # Igual que antes, los IDs 0 no cuentan como trabajo/máquina involucrada
+        job_ids = table['job_id']
+        machine_ids = table['machine_id']
         return {
-            'total_events': len(self.events),
+            'total_events': len(table),
             'event_counts': event_counts,
-            'simulation_time': self.events[-1].time if self.events else 0,
-            'unique_jobs': len(set(e.job_id for e in self.events if e.job_id)),
-            'machines_involved': len(set(e.machine_id for e in self.events if e.machine_id))
+            'simulation_time': float(table['time'][-1]) if len(table) else 0,
+            'unique_jobs': len(np.unique(job_ids[(job_ids != -1) & (job_ids != 0)])),
+            'machines_involved': len(np.unique(machine_ids[(machine_ids != -1) & (machine_ids != 0)]))
         }
     
     def print_event_summary(self):
@@ -212,20 +323,28 @@ class EventManager:
         
         print("="*70 + "\n")
     
+    def _select(self, mask: np.ndarray) -> List[SimulationEvent]:
+        table = self.table
+        indices = np.flatnonzero(mask)
+        return [self._to_event(int(i), row) for i, row in zip(indices, table[indices].tolist())]
+    
     def get_events_by_type(self, event_type: str) -> List[SimulationEvent]:
         """Retorna eventos de un tipo específico."""
-        return [e for e in self.events if e.event_type == event_type]
+        code = self._type_codes.get(event_type)
+        if code is None:
+            return []
+        return self._select(self.table['type'] == code)
     
     def get_events_by_job(self, job_id: int) -> List[SimulationEvent]:
         """Retorna todos los eventos de un trabajo específico."""
-        return [e for e in self.events if e.job_id == job_id]
+        return self._select(self.table['job_id'] == job_id)
     
     def get_events_by_machine(self, machine_id: int) -> List[SimulationEvent]:
         """Retorna todos los eventos de una máquina específica."""
-        return [e for e in self.events if e.machine_id == machine_id]
+        return self._select(self.table['machine_id'] == machine_id)
     
     def reset(self):
         """Resetea el gestor de eventos."""
-        self.events = []
+        self._init_storage()
         self.start_time = None
         self.end_time = None
@@ -11,6 +11,8 @@ Protocolo Contract Net:
 
 import zmq
 import json
+import threading
+from collections import deque
 from typing import Dict, List, Optional, Tuple
 import time
 
@@ -18,20 +20,90 @@ import time
 class JADECNPClient:
     """Cliente para comunicación CNP entre SimPy y JADE."""
     
-    def __init__(self, server_address: str = "tcp://localhost:5555", timeout: int = 5000):
+    def __init__(self, server_address: str = "tcp://localhost:5555", timeout: int = 5000,
+                 flush_interval: float = 0.05, batch_size: int = 64):
         """
         Args:
             server_address: Dirección del servidor ZeroMQ en JADE
             timeout: Timeout para operaciones en ms
+            flush_interval: Cada cuántos segundos el hilo de fondo envía las notificaciones pendientes
+            batch_size: Notificaciones pendientes que fuerzan un envío anticipado
         """
         self.context = zmq.Context()
-        self.socket = self.context.socket(zmq.REQ)
-        self.socket.setsockopt(zmq.RCVTIMEO, timeout)
-        self.socket.setsockopt(zmq.SNDTIMEO, timeout)
-        self.socket.connect(server_address)
+        self.socket = self._create_socket(server_address, timeout)
         self.server_address = server_address
         self.timeout = timeout
         
+        # Notificaciones fire-and-forget (inicio/fin de operación) enviadas en lote
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._notifications = deque()
+        self._send_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._notifier = None
+    
+    def _create_socket(self, server_address: str, timeout: int) -> zmq.Socket:
+        socket = self.context.socket(zmq.REQ)
+        socket.setsockopt(zmq.RCVTIMEO, timeout)
+        socket.setsockopt(zmq.SNDTIMEO, timeout)
+        socket.setsockopt(zmq.LINGER, 0)
+        socket.connect(server_address)
+        return socket
+    
+    def queue_notification(self, request: Dict):
+        """
+        Encola una notificación sin esperar respuesta de JADE.
+        
+        Un hilo de fondo las envía en lote ("notification_batch") cada
+        `flush_interval` segundos o al juntar `batch_size`; las solicitudes
+        síncronas envían antes las pendientes para conservar el orden.
+        """
+        if self._notifier is None:
+            self._notifier = threading.Thread(target=self._notification_loop, daemon=True)
+            self._notifier.start()
+        self._notifications.append(request)
+        if len(self._notifications) >= self.batch_size:
+            self._wakeup.set()
+    
+    def _send_pending(self, socket: zmq.Socket) -> zmq.Socket:
+        """Envía por `socket` las notificaciones pendientes; retorna el socket utilizable."""
+        with self._send_lock:
+            if not self._notifications:
+                return socket
+            batch = []
+            while self._notifications:
+                batch.append(self._notifications.popleft())
+            try:
+                socket.send_json({"action": "notification_batch", "notifications": batch})
+                response = socket.recv_json()
+                if response.get("status") != "success":
+                    print(f"[CNP] Error en lote de notificaciones: {response.get('message')}")
+            except zmq.error.Again:
+                # Un REQ sin respuesta queda bloqueado: reemplazarlo
+                print(f"[CNP] Timeout enviando {len(batch)} notificaciones")
+                socket.close()
+                socket = self._create_socket(self.server_address, self.timeout)
+            except Exception as e:
+                print(f"[CNP] Error enviando notificaciones: {e}")
+            return socket
+    
+    def _notification_loop(self):
+        """Hilo de fondo con su propio socket REQ (los sockets ZMQ no son thread-safe)."""
+        socket = self._create_socket(self.server_address, self.timeout)
+        try:
+            while not self._stop.is_set():
+                self._wakeup.wait(self.flush_interval)
+                self._wakeup.clear()
+                socket = self._send_pending(socket)
+            socket = self._send_pending(socket)
+        finally:
+            socket.close()
+    
+    def flush_notifications(self):
+        """Envía las notificaciones pendientes por el socket principal."""
+        self.socket = self._send_pending(self.socket)
+        
     def create_order_agent(self, job_id: int, operations: List[Dict], due_date: float, 
                           current_time: float) -> Optional[str]:
         """
@@ -55,6 +127,7 @@ class JADECNPClient:
                 "current_time": current_time
             }
             
+            self.flush_notifications()
             self.socket.send_json(request)
             response = self.socket.recv_json()
             
@@ -105,6 +178,7 @@ class JADECNPClient:
                 "available_machines": available_machines
             }
             
+            self.flush_notifications()
             self.socket.send_json(request)
             response = self.socket.recv_json()
             
@@ -131,7 +205,7 @@ class JADECNPClient:
             return None
     
     def notify_operation_start(self, job_id: int, operation_index: int, 
-                               machine_id: int, start_time: float):
+                               machine_id: int, start_time: float, wait: bool = True):
         """
         Notifica a JADE que una operación comenzó en SimPy.
         
@@ -140,6 +214,7 @@ class JADECNPClient:
             operation_index: Índice de operación
             machine_id: ID de máquina asignada
             start_time: Tiempo de inicio
+            wait: Si es False, se encola sin esperar respuesta (ver queue_notification)
         """
         try:
             request = {
@@ -150,6 +225,11 @@ class JADECNPClient:
                 "start_time": start_time
             }
             
+            if not wait:
+                self.queue_notification(request)
+                return
+            
+            self.flush_notifications()
             self.socket.send_json(request)
             response = self.socket.recv_json()
             
@@ -161,7 +241,7 @@ class JADECNPClient:
     
     def notify_operation_complete(self, job_id: int, operation_index: int, 
                                   machine_id: int, completion_time: float,
-                                  is_last_operation: bool = False):
+                                  is_last_operation: bool = False, wait: bool = True):
         """
         Notifica a JADE que una operación terminó.
         
@@ -171,6 +251,7 @@ class JADECNPClient:
             machine_id: ID de máquina
             completion_time: Tiempo de finalización
             is_last_operation: True si es la última operación del job
+            wait: Si es False, se encola sin esperar respuesta (ver queue_notification)
         """
         try:
             request = {
@@ -182,6 +263,11 @@ class JADECNPClient:
                 "is_last_operation": is_last_operation
             }
             
+            if not wait:
+                self.queue_notification(request)
+                return
+            
+            self.flush_notifications()
             self.socket.send_json(request)
             response = self.socket.recv_json()
             
@@ -211,6 +297,7 @@ class JADECNPClient:
                 "affected_job_id": affected_job_id
             }
             
+            self.flush_notifications()
             self.socket.send_json(request)
             response = self.socket.recv_json()
             
@@ -236,6 +323,7 @@ class JADECNPClient:
                 "repair_time": repair_time
             }
             
+            self.flush_notifications()
             self.socket.send_json(request)
             response = self.socket.recv_json()
             
@@ -261,6 +349,7 @@ class JADECNPClient:
                 "machine_id": machine_id
             }
             
+            self.flush_notifications()
             self.socket.send_json(request)
             response = self.socket.recv_json()
             
@@ -275,6 +364,11 @@ class JADECNPClient:
     
     def close(self):
         """Cierra conexión con JADE."""
+        if self._notifier is not None:
+            self._stop.set()
+            self._wakeup.set()
+            self._notifier.join()
+            self._notifier = None
         try:
             self.socket.close()
             self.context.term()
@@ -309,6 +403,7 @@ class JADECNPClient:
             
             print(f"[CNP] Solicitando re-negociación para Job {job_id} op {operation_index}")
             
+            self.flush_notifications()
             self.socket.send_json(request)
             response = self.socket.recv_json()
             
@@ -7,6 +7,8 @@ error o timeout, aplica una política fallback (SPT) usando
 """
 import json
 import zmq
+import simpy
+from collections import deque
 from typing import List, Dict, Any, Optional
 
 try:
@@ -62,6 +64,94 @@ class ZmqClient:
             cls._socket.close()
             cls._socket = None
 
+class AsyncDecisionClient:
+    """Cliente de decisiones no bloqueante sobre un socket DEALER.
+    
+    Las solicitudes emitidas en un mismo instante simulado se envían en
+    cadena sin esperar respuesta; un proceso SimPy recolector las recibe
+    después (en el mismo instante) y dispara el evento de cada una. El
+    servidor REP responde en orden, por lo que el emparejamiento es FIFO.
+    """
+    _instance: Optional["AsyncDecisionClient"] = None
+
+    def __init__(self, env: simpy.Environment, addr: str = DEFAULT_JADE_ZMQ_ADDR,
+                 timeout_ms: int = 2000):
+        self.env = env
+        self.addr = addr
+        self.timeout_ms = timeout_ms
+        self._socket: Optional[zmq.Socket] = None
+        self._pending = deque()
+        self._collecting = False
+
+    @classmethod
+    def get(cls, env: simpy.Environment, addr: str = DEFAULT_JADE_ZMQ_ADDR,
+            timeout_ms: int = 2000) -> "AsyncDecisionClient":
+        inst = cls._instance
+        if inst is None or inst.addr != addr:
+            if inst is not None:
+                inst._reset_socket()
+            inst = cls._instance = cls(env, addr, timeout_ms)
+        elif inst.env is not env:
+            # Nuevo episodio: descartar solicitudes del entorno anterior
+            inst._reset_socket()
+            inst.env = env
+            inst._pending.clear()
+            inst._collecting = False
+        inst.timeout_ms = timeout_ms
+        return inst
+
+    def _get_socket(self) -> zmq.Socket:
+        if self._socket is None:
+            if ZmqClient._context is None:
+                ZmqClient._context = zmq.Context()
+            self._socket = ZmqClient._context.socket(zmq.DEALER)
+            self._socket.setsockopt(zmq.LINGER, 0)
+            self._socket.connect(self.addr)
+        return self._socket
+
+    def _reset_socket(self):
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def request(self, payload: Dict[str, Any]) -> simpy.Event:
+        """Envía `payload` y retorna un evento que se dispara con la respuesta."""
+        event = self.env.event()
+        try:
+            # Frame vacío: delimitador de sobre que espera el socket REP
+            self._get_socket().send_multipart([b"", json.dumps(payload).encode("utf-8")])
+        except Exception as e:
+            self._reset_socket()
+            event.fail(e)
+            return event
+        
+        self._pending.append(event)
+        if not self._collecting:
+            self._collecting = True
+            self.env.process(self._collect())
+        return event
+
+    def _collect(self):
+        # Ceder el instante actual para que otros procesos emitan sus solicitudes
+        yield self.env.timeout(0)
+        sock = self._get_socket()
+        while self._pending:
+            if not sock.poll(self.timeout_ms):
+                # Timeout: el lote pendiente se da por perdido
+                error = TimeoutError("ZMQ Request timed out")
+                while self._pending:
+                    self._pending.popleft().fail(error)
+                self._reset_socket()
+                break
+            frames = sock.recv_multipart()
+            event = self._pending.popleft()
+            try:
+                event.succeed(json.loads(frames[-1]))
+            except Exception as e:
+                event.fail(e)
+        self._collecting = False
+
+
 def send_feedback(machine_id: int, current_job_id: int, queue_jobs: List[Dict], action: int, reward: float,
                  next_state: str = None, next_actions: List[int] = None, 
                  zmq_addr: str = DEFAULT_JADE_ZMQ_ADDR,
@@ -116,12 +206,23 @@ def notify_event(event_type: str, payload: Dict[str, Any], zmq_addr: str = DEFAU
         return False
 
 
-def request_decision(machine_id: int, current_job_id: int, queue_jobs: List[Dict], 
-                     zmq_addr: str = DEFAULT_JADE_ZMQ_ADDR,
-                     timeout: float = 2.0) -> Dict[str, Any]:
-    """Solicita decisión al servidor JADE vía ZeroMQ.
+def notify_events_batch(events: List[Dict[str, Any]], zmq_addr: str = DEFAULT_JADE_ZMQ_ADDR,
+                        timeout: float = 2.0) -> bool:
+    """Envía varios eventos de mirroring a JADE en un único round-trip.
+    
+    Cada elemento de `events` tiene el mismo formato que `notify_event`
+    (clave 'event_type' más su payload). El servidor los procesa en orden.
     """
-    payload = {
+    try:
+        resp = ZmqClient.send_request("event_batch", {'events': events}, timeout_ms=int(timeout * 1000))
+        return isinstance(resp, dict) and resp.get('status') == 'ok'
+    except Exception as e:
+        # print(f"[JADE-ZMQ] batch notification failed: {e}")
+        return False
+
+
+def _decision_payload(machine_id: int, current_job_id: int, queue_jobs: List[Dict]) -> Dict[str, Any]:
+    return {
         'machine_id': machine_id,
         'current_job': current_job_id,
         'queue': [
@@ -133,6 +234,14 @@ def request_decision(machine_id: int, current_job_id: int, queue_jobs: List[Dict
             for j in queue_jobs
         ]
     }
+
+
+def request_decision(machine_id: int, current_job_id: int, queue_jobs: List[Dict], 
+                     zmq_addr: str = DEFAULT_JADE_ZMQ_ADDR,
+                     timeout: float = 2.0) -> Dict[str, Any]:
+    """Solicita decisión al servidor JADE vía ZeroMQ.
+    """
+    payload = _decision_payload(machine_id, current_job_id, queue_jobs)
     
     try:
         resp = ZmqClient.send_request("decide", payload, timeout_ms=int(timeout * 1000))
@@ -142,6 +251,20 @@ def request_decision(machine_id: int, current_job_id: int, queue_jobs: List[Dict
         raise
 
 
+def request_decision_async(env: simpy.Environment, machine_id: int, current_job_id: int,
+                           queue_jobs: List[Dict], zmq_addr: str = DEFAULT_JADE_ZMQ_ADDR,
+                           timeout: float = 2.0) -> simpy.Event:
+    """Versión no bloqueante de `request_decision` para procesos SimPy.
+    
+    Retorna un evento que se dispara con la respuesta (o falla por timeout);
+    el proceso llamador hace `resp = yield event`.
+    """
+    payload = _decision_payload(machine_id, current_job_id, queue_jobs)
+    payload['type'] = "decide"
+    client = AsyncDecisionClient.get(env, zmq_addr, timeout_ms=int(timeout * 1000))
+    return client.request(payload)
+
+
 def decide_allow(machine_id: int, current_job_id: int, queue_jobs: List[Dict],
                 scheduling_rule: str = "SPT", zmq_addr: str = DEFAULT_JADE_ZMQ_ADDR,
                 timeout: float = 0.5) -> bool:
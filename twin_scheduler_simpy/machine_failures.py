@@ -14,9 +14,23 @@ Características:
 
 import simpy
 import numpy as np
-from typing import Dict, List, Tuple, Callable
+from typing import Dict, List, Tuple, Callable, Optional
 from dataclasses import dataclass
 
+# Tamaño de los bloques de muestras aleatorias pre-generadas
+RNG_BLOCK_SIZE = 4096
+
+# Columnas del historial de fallos exportado (mismo orden que el CSV);
+# float32 basta para los tiempos exportados
+FAILURE_DTYPE = np.dtype([
+    ('machine_id', np.int16),
+    ('failure_time', np.float32),
+    ('repair_start', np.float32),
+    ('repair_duration', np.float32),
+    ('repair_end', np.float32),
+    ('total_downtime', np.float32),
+])
+
 
 @dataclass
 class MachineFailureEvent:
@@ -35,26 +49,40 @@ class MachineFailureManager:
     def __init__(self, env: simpy.Environment,
                  num_machines: int,
                  mtbf_mean: float = 100.0,  # Mean Time Between Failures
-                 mttr_mean: float = 5.0):   # Mean Time To Repair
+                 mttr_mean: float = 5.0,    # Mean Time To Repair
+                 rng: Optional[np.random.Generator] = None):
         """
         Args:
             env: Entorno SimPy
             num_machines: Número de máquinas
             mtbf_mean: Tiempo medio entre fallos (exponencial)
             mttr_mean: Tiempo medio de reparación (exponencial)
+            rng: Generador NumPy propio; si es None se usa el RNG global de numpy
         """
         self.env = env
         self.num_machines = num_machines
         self.mtbf_mean = mtbf_mean
         self.mttr_mean = mttr_mean
+        self._rng = rng if rng is not None else np.random
         
-        # Estado de máquinas
-        self.machine_failed = {i: False for i in range(num_machines)}
+        # Estado de máquinas: bit i de failed_mask activo si la máquina i está en falla
+        # (entero de Python, sin límite de máquinas)
+        self.failed_mask = 0
         self.machine_busy = {i: False for i in range(num_machines)}
+        # Evento por máquina que se dispara al terminar la reparación en curso
+        self.repaired_events = [env.event() for _ in range(num_machines)]
+        # Evento por máquina que se dispara cuando la máquina falla
+        self.failed_events = [env.event() for _ in range(num_machines)]
         
         # Historial de fallos
         self.failure_events: List[MachineFailureEvent] = []
         
+        # Tiempos hasta fallo / de reparación pre-muestreados en bloque
+        self._ttf_buffer: List[float] = []
+        self._ttf_idx = 0
+        self._ttr_buffer: List[float] = []
+        self._ttr_idx = 0
+        
         # Callbacks
         self.on_failure_callback = None
         self.on_repair_callback = None
@@ -69,7 +97,19 @@ class MachineFailureManager:
     
     def is_machine_failed(self, machine_id: int) -> bool:
         """Verifica si una máquina está en fallo."""
-        return self.machine_failed.get(machine_id, False)
+        return bool(self.failed_mask >> machine_id & 1)
+    
+    def any_machine_failed(self) -> bool:
+        """Verifica si hay alguna máquina en fallo."""
+        return self.failed_mask != 0
+    
+    def wait_repair(self, machine_id: int) -> simpy.Event:
+        """Retorna el evento que se dispara cuando la máquina queda reparada."""
+        return self.repaired_events[machine_id]
+    
+    def wait_failure(self, machine_id: int) -> simpy.Event:
+        """Retorna el evento que se dispara con la próxima falla de la máquina."""
+        return self.failed_events[machine_id]
     
     def is_machine_busy(self, machine_id: int) -> bool:
         """Verifica si una máquina está ocupada procesando."""
@@ -79,6 +119,24 @@ class MachineFailureManager:
         """Marca máquina como ocupada/desocupada."""
         self.machine_busy[machine_id] = is_busy
     
+    def _next_time_to_failure(self) -> float:
+        """Siguiente tiempo hasta fallo exponencial del bloque pre-muestreado."""
+        if self._ttf_idx >= len(self._ttf_buffer):
+            self._ttf_buffer = self._rng.exponential(self.mtbf_mean, size=RNG_BLOCK_SIZE).tolist()
+            self._ttf_idx = 0
+        time_to_failure = self._ttf_buffer[self._ttf_idx]
+        self._ttf_idx += 1
+        return time_to_failure
+    
+    def _next_repair_duration(self) -> float:
+        """Siguiente duración de reparación exponencial del bloque pre-muestreado."""
+        if self._ttr_idx >= len(self._ttr_buffer):
+            self._ttr_buffer = self._rng.exponential(self.mttr_mean, size=RNG_BLOCK_SIZE).tolist()
+            self._ttr_idx = 0
+        repair_duration = self._ttr_buffer[self._ttr_idx]
+        self._ttr_idx += 1
+        return repair_duration
+    
     def failure_process(self, machine_id: int):
         """
         Proceso que simula el ciclo de fallos de una máquina.
@@ -86,15 +144,19 @@ class MachineFailureManager:
         """
         while True:
             # Esperar hasta próximo fallo (distribución exponencial)
-            time_to_failure = np.random.exponential(self.mtbf_mean)
+            time_to_failure = self._next_time_to_failure()
             yield self.env.timeout(time_to_failure)
             
             # Registrar fallo
             failure_time = self.env.now
-            self.machine_failed[machine_id] = True
+            self.failed_mask |= 1 << machine_id
+            if self.repaired_events[machine_id].triggered:
+                self.repaired_events[machine_id] = self.env.event()
+            if not self.failed_events[machine_id].triggered:
+                self.failed_events[machine_id].succeed()
             
             # Generar tiempo de reparación
-            repair_duration = max(1, np.random.exponential(self.mttr_mean))
+            repair_duration = max(1, self._next_repair_duration())
             repair_start_time = self.env.now
             
             # Notificar fallo
@@ -113,7 +175,11 @@ class MachineFailureManager:
             yield self.env.timeout(repair_duration)
             
             # Máquina repuesta
-            self.machine_failed[machine_id] = False
+            self.failed_mask &= ~(1 << machine_id)
+            if not self.repaired_events[machine_id].triggered:
+                self.repaired_events[machine_id].succeed()
+            if self.failed_events[machine_id].triggered:
+                self.failed_events[machine_id] = self.env.event()
             repair_end_time = self.env.now
             downtime = repair_end_time - failure_time
             
@@ -181,10 +247,26 @@ class MachineFailureManager:
         """Retorna todos los eventos de fallo registrados."""
         return self.failure_events.copy()
     
+    @property
+    def failure_table(self) -> np.ndarray:
+        """Historial de fallos como array estructurado (ver FAILURE_DTYPE)."""
+        return np.array(
+            [(e.machine_id, e.failure_time, e.repair_start_time,
+              e.repair_duration, e.repair_end_time, e.downtime)
+             for e in self.failure_events],
+            dtype=FAILURE_DTYPE
+        )
+    
     def reset(self):
         """Resetea el gestor de fallos."""
-        self.machine_failed = {i: False for i in range(self.num_machines)}
+        self.failed_mask = 0
+        self.repaired_events = [self.env.event() for _ in range(self.num_machines)]
+        self.failed_events = [self.env.event() for _ in range(self.num_machines)]
         self.failure_events = []
+        self._ttf_buffer = []
+        self._ttf_idx = 0
+        self._ttr_buffer = []
+        self._ttr_idx = 0
 
 
 # ============================================================================
@@ -57,6 +57,7 @@ def run_phase1_batch(
     print("="*80)
     
     results_phase1 = {}
+    num_machines = len(set(m for job in jobs_data for m, _ in job))
     
     for rule in rules:
         print(f"\n[FASE 1] Ejecutando regla: {rule}")
@@ -67,7 +68,8 @@ def run_phase1_batch(
                 rule=rule,
                 dataset_name=dataset_name,
                 verbose=False,
-                export_log=False
+                export_log=False,
+                num_machines=num_machines
             )
             results_phase1[rule] = result['metrics']
             print(f"[FASE 1] {rule}: OK - Makespan={result['metrics']['makespan']:.1f}, "
@@ -143,11 +145,11 @@ def run_phase2_batch(
             
             # Recolectar métricas
             metrics = {
-                'makespan': max([j['completion_time'] for j in simulator.jobs_completed.values()]) if simulator.jobs_completed else 0,
-                'tardiness_total': sum([j['tardiness'] for j in simulator.jobs_completed.values()]) if simulator.jobs_completed else 0,
-                'tardiness_average': np.mean([j['tardiness'] for j in simulator.jobs_completed.values()]) if simulator.jobs_completed else 0,
+                'makespan': max([j.completion_time for j in simulator.jobs_completed.values()]) if simulator.jobs_completed else 0,
+                'tardiness_total': sum([j.tardiness for j in simulator.jobs_completed.values()]) if simulator.jobs_completed else 0,
+                'tardiness_average': np.mean([j.tardiness for j in simulator.jobs_completed.values()]) if simulator.jobs_completed else 0,
                 'jobs_completed': len(simulator.jobs_completed),
-                'total_events': len(simulator.event_manager.events),
+                'total_events': simulator.event_manager.num_events,
                 'total_downtime': sum([
                     simulator.failure_manager.get_failure_stats(m)['total_downtime']
                     for m in range(num_machines)
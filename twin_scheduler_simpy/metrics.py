@@ -3,39 +3,189 @@ Cálculo de métricas del simulador estático.
 Incluye: Makespan, Tardanza, VIP (Work In Progress), Utilización.
 """
 
-import pandas as pd
 from typing import Dict, List, Tuple
 
+import numpy as np
+
+# numba es opcional: sin él el kernel se ejecuta como Python puro
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+class EventBuffer:
+    """
+    Log de eventos del simulador estático en columnas (time, event, job, machine).
+    
+    Las filas se acumulan como tuplas y se vuelcan por bloques a cuatro arrays
+    NumPy con crecimiento geométrico; el tipo de evento se codifica como int8.
+    """
+    
+    START = 0
+    FINISH = 1
+    EVENT_NAMES = ("start", "finish")
+    
+    _PENDING_ROWS = 4096
+    
+    def __init__(self, capacity: int = 1024):
+        self._times = np.empty(capacity, dtype=np.float64)
+        self._events = np.empty(capacity, dtype=np.int8)
+        self._jobs = np.empty(capacity, dtype=np.int32)
+        self._machines = np.empty(capacity, dtype=np.int16)
+        self._size = 0
+        self._rows: List[tuple] = []
+    
+    @classmethod
+    def from_rows(cls, rows: List[List]) -> "EventBuffer":
+        """Construye el buffer desde un log [time, event, job, machine] con eventos en texto."""
+        buffer = cls(max(len(rows), 1))
+        codes = {name: code for code, name in enumerate(cls.EVENT_NAMES)}
+        for time, event, job_id, machine_id in rows:
+            buffer.append(time, codes[event], job_id, machine_id)
+        return buffer
+    
+    def append(self, time: float, event: int, job_id: int, machine_id: int):
+        """Registra un evento (event = EventBuffer.START o EventBuffer.FINISH)."""
+        rows = self._rows
+        rows.append((time, event, job_id, machine_id))
+        if len(rows) >= self._PENDING_ROWS:
+            self._flush()
+    
+    def _flush(self):
+        """Vuelca las filas pendientes a las columnas, duplicando capacidad si hace falta."""
+        if not self._rows:
+            return
+        start = self._size
+        end = start + len(self._rows)
+        if end > len(self._times):
+            capacity = len(self._times)
+            while capacity < end:
+                capacity *= 2
+            for name in ("_times", "_events", "_jobs", "_machines"):
+                column = getattr(self, name)
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:start] = column[:start]
+                setattr(self, name, grown)
+        times, events, jobs, machines = zip(*self._rows)
+        self._times[start:end] = times
+        self._events[start:end] = events
+        self._jobs[start:end] = jobs
+        self._machines[start:end] = machines
+        self._size = end
+        self._rows = []
+    
+    def __len__(self) -> int:
+        return self._size + len(self._rows)
+    
+    def columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Vistas (times, events, jobs, machines) sobre los eventos registrados."""
+        self._flush()
+        n = self._size
+        return self._times[:n], self._events[:n], self._jobs[:n], self._machines[:n]
+    
+    def to_columns(self, integer_times: bool = False) -> dict:
+        """
+        Columnas time, event (texto), job, machine listas para exportar.
+        
+        Args:
+            integer_times: Si True, los tiempos se devuelven como enteros (el
+                simulador con duraciones enteras solo produce tiempos enteros)
+        """
+        times, events, jobs, machines = self.columns()
+        if integer_times:
+            times = times.astype(np.int64)
+        return {
+            "time": times,
+            "event": np.array(self.EVENT_NAMES, dtype=object)[events],
+            "job": jobs,
+            "machine": machines,
+        }
+    
+    def to_rows(self, integer_times: bool = False) -> List[List]:
+        """Log como lista de filas [time, event (texto), job, machine] (formato de from_rows)."""
+        columns = self.to_columns(integer_times)
+        return [list(row) for row in zip(columns["time"].tolist(), columns["event"].tolist(),
+                                         columns["job"].tolist(), columns["machine"].tolist())]
+    
+    def to_dataframe(self, integer_times: bool = False):
+        """DataFrame con columnas time, event (texto), job, machine."""
+        import pandas as pd
+        return pd.DataFrame(self.to_columns(integer_times))
+
+
+@njit(cache=True)
+def _compute_metrics(times, is_finish, jobs, machines, num_jobs, num_machines):
+    """
+    Recorre el log una sola vez, en orden cronológico.
+    
+    Returns:
+        (makespan, completion, busy, seen): makespan, fin de cada job (-1 si no
+        terminó), tiempo ocupado por máquina y máquinas presentes en el log
+    """
+    makespan = 0.0
+    completion = np.full(num_jobs, -1.0)
+    busy = np.zeros(num_machines)
+    seen = np.zeros(num_machines, dtype=np.bool_)
+    start = np.zeros(num_machines)
+    running = np.zeros(num_machines, dtype=np.bool_)
+    
+    for i in range(times.shape[0]):
+        t = times[i]
+        m = machines[i]
+        seen[m] = True
+        if is_finish[i]:
+            if t > makespan:
+                makespan = t
+            j = jobs[i]
+            if t > completion[j]:
+                completion[j] = t
+            if running[m]:
+                busy[m] += t - start[m]
+                running[m] = False
+        else:
+            start[m] = t
+            running[m] = True
+    
+    return makespan, completion, busy, seen
+
 
 class MetricsCalculator:
     """Calcula métricas de desempeño del sistema de manufactura."""
     
-    def __init__(self, log: List[List], jobs_data: List[List[Tuple]], due_dates: Dict[int, float] = None):
+    def __init__(self, log: EventBuffer, jobs_data: List[List[Tuple]], due_dates: Dict[int, float] = None):
         """
         Args:
-            log: Lista de eventos [time, event, job, machine]
+            log: EventBuffer (o lista de eventos [time, event, job, machine])
             jobs_data: Lista de trabajos con sus operaciones
             due_dates: Diccionario {job_id: due_date} (opcional)
         """
         self.log = log
         self.jobs_data = jobs_data
         self.due_dates = due_dates or {}
-        self.df = pd.DataFrame(log, columns=["time", "event", "job", "machine"])
+        
+        # Columnas del log y reducción única sobre ellas
+        if not isinstance(log, EventBuffer):
+            log = EventBuffer.from_rows(log)
+        times, events, jobs, machines = log.columns()
+        is_finish = events == EventBuffer.FINISH
+        n = len(times)
+        num_jobs = int(jobs.max()) + 1 if n else 0
+        num_machines = int(machines.max()) + 1 if n else 0
+        (self._makespan, self._completion,
+         self._busy, self._seen) = _compute_metrics(
+            times, is_finish, jobs, machines, num_jobs, num_machines
+        )
         
     def calculate_makespan(self) -> float:
         """
         Calcula el MAKESPAN: tiempo total desde el primer evento hasta el último.
         Makespan = max(tiempo de finalización de todos los jobs)
         """
-        if self.df.empty:
-            return 0
-        
-        finish_events = self.df[self.df["event"] == "finish"]
-        if finish_events.empty:
-            return 0
-            
-        makespan = finish_events["time"].max()
-        return makespan
+        return float(self._makespan)
     
     def calculate_tardiness(self) -> Tuple[float, float, int]:
         """
@@ -46,21 +196,12 @@ class MetricsCalculator:
         Returns:
             (tardanza_total, tardanza_promedio, count_with_due_date)
         """
-        job_completion_times = {}
-        
-        # Obtener tiempo de finalización de cada job
-        finish_events = self.df[self.df["event"] == "finish"]
-        for _, row in finish_events.iterrows():
-            job_id = row["job"]
-            end_time = row["time"]
-            if job_id not in job_completion_times or end_time > job_completion_times[job_id]:
-                job_completion_times[job_id] = end_time
-        
         tardiness_total = 0
         count = 0
         
-        for job_id, completion_time in job_completion_times.items():
-            if job_id in self.due_dates:
+        # Tiempo de finalización de cada job (solo los que terminaron)
+        for job_id, completion_time in enumerate(self._completion.tolist()):
+            if completion_time >= 0 and job_id in self.due_dates:
                 due_date = self.due_dates[job_id]
                 tardiness = max(0, completion_time - due_date)
                 tardiness_total += tardiness
@@ -98,25 +239,11 @@ class MetricsCalculator:
         if makespan == 0:
             return {}
         
-        utilization = {}
-        
-        # Para cada máquina, calcular tiempo ocupado
-        for machine_id in self.df["machine"].unique():
-            machine_events = self.df[self.df["machine"] == machine_id]
-            
-            busy_time = 0
-            current_start = None
-            
-            for _, row in machine_events.sort_values("time").iterrows():
-                if row["event"] == "start":
-                    current_start = row["time"]
-                elif row["event"] == "finish" and current_start is not None:
-                    busy_time += row["time"] - current_start
-                    current_start = None
-            
-            utilization[machine_id] = (busy_time / makespan) * 100
-        
-        return utilization
+        return {
+            machine_id: (busy_time / makespan) * 100
+            for machine_id, busy_time in enumerate(self._busy.tolist())
+            if self._seen[machine_id]
+        }
     
     def calculate_average_utilization(self) -> float:
         """Calcula la utilización promedio de todas las máquinas."""
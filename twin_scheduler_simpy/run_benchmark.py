@@ -41,9 +41,9 @@ def run_benchmark():
             # Calcular métricas
             completed_jobs = len(sim.jobs_completed)
             if completed_jobs > 0:
-                tardiness_vals = [info['tardiness'] for info in sim.jobs_completed.values()]
+                tardiness_vals = [info.tardiness for info in sim.jobs_completed.values()]
                 # En este simulador, 'makespan' en jobs_completed es el tiempo de flujo del trabajo individual
-                flow_time_vals = [info['makespan'] for info in sim.jobs_completed.values()] 
+                flow_time_vals = [info.makespan for info in sim.jobs_completed.values()] 
                 
                 avg_tardiness = sum(tardiness_vals) / completed_jobs
                 avg_flow_time = sum(flow_time_vals) / completed_jobs
@@ -26,6 +26,8 @@ def run_mirroring_episode(duration=2000):
     )
     
     env.run(until=duration)
+    # Enviar a JADE el último lote de eventos pendiente
+    sim.flush_mirror()
     
     completed = len(sim.jobs_completed)
     print(f"--- Fin Simulación | Completados: {completed} ---")
@@ -39,15 +39,15 @@ def run_test_episode(duration=500):
         flow_time = []
         for jid, info in sim.jobs_completed.items():
             # info ya contiene los datos calculados por el simulador
-            ft = info['makespan'] # Flow time es equivalente a makespan del trabajo individual
+            ft = info.makespan # Flow time es equivalente a makespan del trabajo individual
             flow_time.append(ft)
-            lat = info['tardiness']
+            lat = info.tardiness
             tardiness.append(lat)
         
         if tardiness:
             print(f"Tardanza Promedio: {np.mean(tardiness):.2f}")
             print(f"Flow Time Promedio: {np.mean(flow_time):.2f}")
-            print(f"Makespan (aprox): {max([info['completion_time'] for info in sim.jobs_completed.values()]):.2f}")
+            print(f"Makespan (aprox): {max([info.completion_time for info in sim.jobs_completed.values()]):.2f}")
 
 if __name__ == "__main__":
     run_test_episode(duration=1000)
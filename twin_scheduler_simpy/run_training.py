@@ -5,28 +5,17 @@ la comunicación vía ZeroMQ para la toma de decisiones y feedback.
 """
 import simpy
 import random
+import logging
 import numpy as np
 from simulator_dynamic import DynamicJobShopSimulator
 
-def run_training_episode(episode_id, duration=1000):
-    env = simpy.Environment()
-    
-    # Configuración del entorno
-    num_machines = 6  # Ejemplo: FT06 tiene 6 máquinas
-    arrival_rate = 0.5
+def run_training_episode(sim, episode_id, duration=1000):
+    # Reutilizar el simulador: solo se reinicia el estado del episodio
+    sim.reset(seed=42 + episode_id)
     
     print(f"--- Iniciando Episodio {episode_id} ---")
     
-    sim = DynamicJobShopSimulator(
-        env=env,
-        num_machines=num_machines,
-        arrival_rate=arrival_rate,
-        scheduling_rule="JADE",  # Activa el agente externo
-        random_seed=42 + episode_id,
-        training=True
-    )
-    
-    env.run(until=duration)
+    sim.env.run(until=duration)
     
     # Calcular métricas básicas del episodio
     completed = len(sim.jobs_completed)
@@ -36,7 +25,23 @@ if __name__ == "__main__":
     NUM_EPISODES = 20
     EPISODE_DURATION = 2000
     
+    # Silenciar trazas por evento durante el entrenamiento
+    logging.getLogger().setLevel(logging.WARNING)
+    
     print(f"Iniciando entrenamiento por {NUM_EPISODES} episodios de {EPISODE_DURATION} u.t. cada uno.")
     
+    # Configuración del entorno
+    num_machines = 6  # Ejemplo: FT06 tiene 6 máquinas
+    arrival_rate = 0.5
+    
+    sim = DynamicJobShopSimulator(
+        env=simpy.Environment(),
+        num_machines=num_machines,
+        arrival_rate=arrival_rate,
+        scheduling_rule="JADE",  # Activa el agente externo
+        random_seed=42,
+        training=True
+    )
+    
     for i in range(1, NUM_EPISODES + 1):
-        run_training_episode(i, duration=EPISODE_DURATION)
+        run_training_episode(sim, i, duration=EPISODE_DURATION)
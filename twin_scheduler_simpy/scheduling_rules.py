@@ -5,6 +5,104 @@ Implementa: SPT, EDD, LPT
 
 from typing import List, Tuple, Callable
 
+import numpy as np
+
+# numba es opcional: sin él los kernels se ejecutan como NumPy puro
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+# ============================================================================
+# KERNELS NUMÉRICOS DE DESPACHO
+# ============================================================================
+# Reciben arrays alineados con la cola (tiempo total de cada trabajo y su
+# fecha de entrega) y retornan los índices ordenados según la regla. El
+# orden es estable: los empates se resuelven por orden de llegada.
+
+@njit(cache=True)
+def spt_order(durations: np.ndarray, due_dates: np.ndarray) -> np.ndarray:
+    """SPT: menor tiempo de procesamiento primero."""
+    return np.argsort(durations, kind='mergesort')
+
+
+@njit(cache=True)
+def edd_order(durations: np.ndarray, due_dates: np.ndarray) -> np.ndarray:
+    """EDD: fecha de entrega más temprana primero."""
+    return np.argsort(due_dates, kind='mergesort')
+
+
+@njit(cache=True)
+def lpt_order(durations: np.ndarray, due_dates: np.ndarray) -> np.ndarray:
+    """LPT: mayor tiempo de procesamiento primero."""
+    return np.argsort(-durations, kind='mergesort')
+
+
+RULE_KERNELS = {
+    "SPT": spt_order,
+    "EDD": edd_order,
+    "LPT": lpt_order,
+}
+
+
+RULE_DESCRIPTIONS = {
+    "SPT": "SPT - Shortest Processing Time (trabajos más cortos primero)",
+    "EDD": "EDD - Earliest Due Date (fecha de entrega más temprana primero)",
+    "LPT": "LPT - Longest Processing Time (trabajos más largos primero)",
+}
+
+
+def rule_arrays(jobs_data: List[List[Tuple]], due_dates: dict = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Arrays de entrada de los kernels: tiempo total de cada trabajo y su fecha
+    de entrega (inf si no tiene).
+    """
+    num_jobs = len(jobs_data)
+    durations = np.fromiter(
+        (sum(duration for _, duration in job) for job in jobs_data),
+        dtype=np.float64, count=num_jobs
+    )
+    if due_dates:
+        due = np.fromiter(
+            (due_dates.get(i, np.inf) for i in range(num_jobs)),
+            dtype=np.float64, count=num_jobs
+        )
+    else:
+        due = np.full(num_jobs, np.inf)
+    return durations, due
+
+
+# ============================================================================
+# CLAVES DE PRIORIDAD
+# ============================================================================
+# Clave escalar por trabajo (menor = antes) para colas de prioridad como
+# simpy.PriorityResource, que atiende los empates en orden de llegada.
+
+def spt_key(job_operations: List[Tuple[int, int]], due_date: float = None) -> float:
+    """SPT: tiempo total de procesamiento."""
+    return sum(duration for _, duration in job_operations)
+
+
+def edd_key(job_operations: List[Tuple[int, int]], due_date: float = None) -> float:
+    """EDD: fecha de entrega (sin fecha, al final)."""
+    return due_date if due_date is not None else float('inf')
+
+
+def lpt_key(job_operations: List[Tuple[int, int]], due_date: float = None) -> float:
+    """LPT: tiempo total de procesamiento, negado."""
+    return -sum(duration for _, duration in job_operations)
+
+
+PRIORITY_KEYS = {
+    "SPT": spt_key,
+    "EDD": edd_key,
+    "LPT": lpt_key,
+}
+
 
 class SchedulingRules:
     """Implementa reglas de despacho para ordenar trabajos."""
@@ -34,16 +132,12 @@ class SchedulingRules:
         Returns:
             Lista de índices de jobs ordenados por SPT
         """
-        job_indices = list(range(len(jobs_data)))
         job_times = [
-            SchedulingRules.get_job_processing_time(jobs_data[i])
-            for i in job_indices
+            SchedulingRules.get_job_processing_time(job) for job in jobs_data
         ]
         
         # Ordenar por tiempo de procesamiento (menor primero)
-        sorted_indices = sorted(job_indices, key=lambda i: job_times[i])
-        
-        return sorted_indices
+        return sorted(range(len(job_times)), key=job_times.__getitem__)
     
     @staticmethod
     def EDD(jobs_data: List[List[Tuple]], due_dates: dict = None) -> List[int]:
@@ -62,15 +156,9 @@ class SchedulingRules:
             # Si no hay fechas de entrega, usar orden original
             return list(range(len(jobs_data)))
         
-        job_indices = list(range(len(jobs_data)))
-        
         # Ordenar por fecha de entrega (menor primero)
-        sorted_indices = sorted(
-            job_indices,
-            key=lambda i: due_dates.get(i, float('inf'))
-        )
-        
-        return sorted_indices
+        job_due = [due_dates.get(i, float('inf')) for i in range(len(jobs_data))]
+        return sorted(range(len(job_due)), key=job_due.__getitem__)
     
     @staticmethod
     def LPT(jobs_data: List[List[Tuple]], due_dates: dict = None) -> List[int]:
@@ -86,16 +174,12 @@ class SchedulingRules:
         Returns:
             Lista de índices de jobs ordenados por LPT
         """
-        job_indices = list(range(len(jobs_data)))
         job_times = [
-            SchedulingRules.get_job_processing_time(jobs_data[i])
-            for i in job_indices
+            SchedulingRules.get_job_processing_time(job) for job in jobs_data
         ]
         
         # Ordenar por tiempo de procesamiento (mayor primero)
-        sorted_indices = sorted(job_indices, key=lambda i: job_times[i], reverse=True)
-        
-        return sorted_indices
+        return sorted(range(len(job_times)), key=job_times.__getitem__, reverse=True)
     
     @staticmethod
     def apply_rule(rule_name: str, jobs_data: List[List[Tuple]], 
@@ -111,19 +195,15 @@ class SchedulingRules:
         Returns:
             Tupla (lista_ordenada_de_indices, descripcion_de_regla)
         """
-        if rule_name.upper() == "SPT":
-            ordered = SchedulingRules.SPT(jobs_data, due_dates)
-            desc = "SPT - Shortest Processing Time (trabajos más cortos primero)"
-        elif rule_name.upper() == "EDD":
-            ordered = SchedulingRules.EDD(jobs_data, due_dates)
-            desc = "EDD - Earliest Due Date (fecha de entrega más temprana primero)"
-        elif rule_name.upper() == "LPT":
-            ordered = SchedulingRules.LPT(jobs_data, due_dates)
-            desc = "LPT - Longest Processing Time (trabajos más largos primero)"
-        else:
+        rule = rule_name.upper()
+        kernel = RULE_KERNELS.get(rule)
+        if kernel is None:
             raise ValueError(f"Regla desconocida: {rule_name}. Use 'SPT', 'EDD' o 'LPT'")
         
-        return ordered, desc
+        # Un solo argsort estable sobre los arrays de la regla
+        durations, due = rule_arrays(jobs_data, due_dates)
+        ordered = kernel(durations, due).tolist()
+        return ordered, RULE_DESCRIPTIONS[rule]
     
     @staticmethod
     def print_schedule(rule_name: str, ordered_indices: List[int], 
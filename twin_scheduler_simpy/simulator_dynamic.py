@@ -11,38 +11,94 @@ Basado en simulator_static.py pero con eventos dinámicos.
 """
 
 import simpy
-import pandas as pd
 import os
+import sys
 import argparse
-from datetime import datetime
+import logging
+import logging.handlers
 from typing import List, Tuple, Dict, Optional
 import numpy as np
+from dataclasses import dataclass
 
 # Intentar imports relativos; si falla, usar imports directos
 try:
     from .arrival_generator import ArrivalGenerator, JobSpec
     from .machine_failures import MachineFailureManager, MachineFailureEvent, ReliabilityProfile
     from .event_manager import EventManager, EventType
-    from .integration.jade_zmq_client import request_decision, send_feedback, notify_event
-    from .scheduling_rules import SchedulingRules
+    from .scheduling_rules import PRIORITY_KEYS, spt_key
+    from .csv_export import write_csv
 except ImportError:
     from arrival_generator import ArrivalGenerator, JobSpec
     from machine_failures import MachineFailureManager, MachineFailureEvent, ReliabilityProfile
     from event_manager import EventManager, EventType
-    from scheduling_rules import SchedulingRules
+    from scheduling_rules import PRIORITY_KEYS, spt_key
+    from csv_export import write_csv
+
+logger = logging.getLogger(__name__)
+
+
+def _load_jade_client():
+    """Importa el cliente ZMQ de JADE solo cuando se necesita (JADE o mirroring).
+
+    Las corridas heurísticas sin mirroring no cargan pyzmq ni crean contexto ZMQ.
+    """
     try:
-        from integration.jade_zmq_client import decide_allow, notify_event
-    except Exception:
-        # decide_allow fallback will be handled at runtime if unavailable
-        def decide_allow(*args, **kwargs):
-            return True
-        def notify_event(*args, **kwargs):
-            return True
+        from .integration import jade_zmq_client
+    except ImportError:
+        from integration import jade_zmq_client
+    return jade_zmq_client
+
+# Trazas por evento desactivadas salvo TS_VERBOSE=1: evita formateo y E/S
+# en el bucle de simulación
+VERBOSE = bool(int(os.environ.get("TS_VERBOSE", "0")))
+
+# Columnas del registro de trabajos completados (mismo orden que el CSV);
+# float32 basta para los tiempos exportados
+JOB_DTYPE = np.dtype([
+    ('job_id', np.int32),
+    ('arrival_time', np.float32),
+    ('completion_time', np.float32),
+    ('makespan', np.float32),
+    ('due_date', np.float32),
+    ('tardiness', np.float32),
+])
+
+
+@dataclass(slots=True)
+class OperationRequest:
+    """Solicitud de un trabajo para ejecutar una operación en una máquina."""
+    job: JobSpec
+    op_idx: int
+    duration: float
+    done: simpy.Event  # Se dispara cuando la operación termina
+
+
+@dataclass(slots=True)
+class JobResult:
+    """Registro de un trabajo completado (ver JOB_DTYPE)."""
+    job_id: int
+    arrival_time: float
+    completion_time: float
+    makespan: float
+    due_date: float
+    tardiness: float
 
 
 class DynamicMachine:
     """Máquina con soporte para fallos dinámicos."""
     
+    __slots__ = ('env', 'id', 'resource', 'failure_manager', 'store',
+                 'total_processing_time', 'num_operations', 'idle_time')
+    
+    env: simpy.Environment
+    id: int
+    resource: simpy.PriorityResource
+    failure_manager: MachineFailureManager
+    store: simpy.Store
+    total_processing_time: float
+    num_operations: int
+    idle_time: float
+    
     def __init__(self, env: simpy.Environment, machine_id: int, 
                  failure_manager: MachineFailureManager):
         """
@@ -53,20 +109,39 @@ class DynamicMachine:
         """
         self.env = env
         self.id = machine_id
-        self.resource = simpy.Resource(env, capacity=1)
-        self.queue = []
+        # Con reglas heurísticas la prioridad del request codifica la regla
+        self.resource = simpy.PriorityResource(env, capacity=1)
         self.failure_manager = failure_manager
+        # Solicitudes de operación pendientes para el despachador JADE
+        self.store = simpy.Store(env)
         
         # Estadísticas
-        self.total_processing_time = 0
+        self.total_processing_time = 0.0
         self.num_operations = 0
-        self.idle_time = 0
+        self.idle_time = 0.0
+    
+    def reset(self, env: simpy.Environment):
+        """Reinicia cola, recurso y estadísticas sobre un nuevo entorno."""
+        self.env = env
+        self.resource = simpy.PriorityResource(env, capacity=1)
+        self.store = simpy.Store(env)
+        self.total_processing_time = 0.0
+        self.num_operations = 0
+        self.idle_time = 0.0
+    
+    @property
+    def queue_length(self) -> int:
+        """Trabajos esperando esta máquina (en el despachador o en el recurso)."""
+        return len(self.store.items) + len(self.resource.queue)
     
     def process(self, job_id: int, duration: float):
         """Procesa operación, verificando fallos."""
-        # Si hay fallo, esperar a que se repare
-        while self.failure_manager.is_machine_failed(self.id):
-            yield self.env.timeout(0.1)
+        fm = self.failure_manager
+        machine_id = self.id
+        bit = 1 << machine_id
+        # Si hay fallo, esperar el evento de reparación en lugar de sondear
+        while fm.failed_mask & bit:
+            yield fm.wait_repair(machine_id)
         
         yield self.env.timeout(duration)
         self.total_processing_time += duration
@@ -84,7 +159,9 @@ class DynamicJobShopSimulator:
                  scheduling_rule: str = "SPT",
                  random_seed: int = 42,
                  training: bool = True,
-                 mirroring: bool = False):
+                 mirroring: bool = False,
+                 mirror_flush_dt: float = 1.0,
+                 mirror_batch_size: int = 256):
         """
         Args:
             env: Entorno SimPy
@@ -96,6 +173,8 @@ class DynamicJobShopSimulator:
             random_seed: Seed para reproducibilidad
             training: Si es True, envía feedback para entrenamiento (solo si rule=JADE)
             mirroring: Si es True, envía eventos de espejo a JADE.
+            mirror_flush_dt: Cada cuántas u.t. se envía el lote de eventos de espejo
+            mirror_batch_size: Tamaño de lote que fuerza un envío anticipado
         """
         self.env = env
         self.num_machines = num_machines
@@ -103,6 +182,31 @@ class DynamicJobShopSimulator:
         self.scheduling_rule = scheduling_rule
         self.training = training
         self.mirroring = mirroring
+        self.mirror_flush_dt = mirror_flush_dt
+        self.mirror_batch_size = mirror_batch_size
+        self._mirror_buffer: List[Dict] = []
+        
+        # Resolver la regla de despacho una sola vez (sin comparar strings por decisión)
+        rule_key = scheduling_rule.upper()
+        self._priority_key = PRIORITY_KEYS.get(rule_key, spt_key)
+        self._jade_mode = rule_key == "JADE"
+        self._send_feedback = self._jade_mode and training
+        # Variante de ejecución por operación, fija para toda la simulación
+        if self._jade_mode:
+            self._run_operation = self._run_operation_jade
+        else:
+            self._run_operation = self._run_operation_rule
+        
+        # Cliente JADE: se importa una sola vez y solo si se va a usar
+        self._jade_client = None
+        if self._jade_mode or mirroring:
+            try:
+                self._jade_client = _load_jade_client()
+            except ImportError as e:
+                if self._jade_mode:
+                    raise
+                logger.warning("Cliente JADE no disponible (%s); mirroring desactivado", e)
+                self.mirroring = False
         
         # Fijar seed para reproducibilidad
         np.random.seed(random_seed)
@@ -126,10 +230,14 @@ class DynamicJobShopSimulator:
             DynamicMachine(env, i, self.failure_manager) for i in range(num_machines)
         ]
         
+        # Un despachador por máquina
+        self._start_dispatchers()
+        
         # Registro de trabajos
         self.jobs_in_progress: Dict[int, JobSpec] = {}
-        self.jobs_completed: Dict[int, Dict] = {}
+        self.jobs_completed: Dict[int, JobResult] = {}
         self.pending_jobs: List[JobSpec] = []
+        self._reset_counters()
         
         # Métricas
         # self.metrics_calculator = MetricsCalculator()
@@ -138,6 +246,88 @@ class DynamicJobShopSimulator:
         # Callbacks
         self._setup_callbacks()
     
+    def reset(self, seed: int):
+        """
+        Prepara un nuevo episodio reutilizando máquinas y gestores.
+        
+        Crea un entorno SimPy nuevo, re-siembra el RNG y limpia colas,
+        registros y estadísticas, evitando reconstruir todo el simulador
+        entre episodios cortos de entrenamiento.
+        
+        Args:
+            seed: Seed del nuevo episodio
+        """
+        self.env = simpy.Environment()
+        np.random.seed(seed)
+        
+        self.failure_manager.env = self.env
+        self.failure_manager.reset()
+        self.arrival_generator.env = self.env
+        self.arrival_generator.reset()
+        self.event_manager.reset()
+        for machine in self.machines:
+            machine.reset(self.env)
+        
+        self.jobs_in_progress.clear()
+        self.jobs_completed.clear()
+        self.pending_jobs.clear()
+        self._reset_counters()
+        self._mirror_buffer = []
+        
+        self.arrival_generator.start()
+        self.failure_manager.start_failure_simulation()
+        self._start_dispatchers()
+    
+    @property
+    def jobs_table(self) -> np.ndarray:
+        """Trabajos completados como array estructurado (ver JOB_DTYPE)."""
+        return np.array(
+            [(j.job_id, j.arrival_time, j.completion_time,
+              j.makespan, j.due_date, j.tardiness)
+             for j in self.jobs_completed.values()],
+            dtype=JOB_DTYPE
+        )
+    
+    def _reset_counters(self):
+        """Acumuladores del resumen, actualizados al completar cada trabajo."""
+        self._num_completed = 0
+        self._sum_makespan = 0.0
+        self._sum_tardiness = 0.0
+        self._num_late = 0
+    
+    def _start_dispatchers(self):
+        """Lanza el despachador JADE de cada máquina (y el proceso de mirroring)."""
+        if self._jade_mode:
+            for machine in self.machines:
+                self.env.process(self._machine_dispatcher(machine))
+        if self.mirroring:
+            self.env.process(self._mirror_flusher())
+    
+    def _mirror(self, event_type: str, payload: Dict):
+        """Encola un evento de mirroring; se envía a JADE en el próximo lote."""
+        event = {'event_type': event_type, 'time': self.env.now}
+        event.update(payload)
+        self._mirror_buffer.append(event)
+        if len(self._mirror_buffer) >= self.mirror_batch_size:
+            self.flush_mirror()
+    
+    def flush_mirror(self):
+        """
+        Envía los eventos de mirroring acumulados en un único round-trip.
+        
+        run() lo llama al terminar; quien ejecute env.run() directamente con
+        mirroring activo debe llamarlo después para no perder el último lote.
+        """
+        if self._mirror_buffer:
+            self._jade_client.notify_events_batch(self._mirror_buffer)
+            self._mirror_buffer = []
+    
+    def _mirror_flusher(self):
+        """Proceso que vacía el buffer de mirroring cada `mirror_flush_dt` u.t."""
+        while True:
+            yield self.env.timeout(self.mirror_flush_dt)
+            self.flush_mirror()
+    
     def _setup_callbacks(self):
         """Configura callbacks para eventos dinámicos."""
         
@@ -159,13 +349,13 @@ class DynamicJobShopSimulator:
             num_operations=len(job.operations)
         )
         
-        if True:  # verbose
-            print(f"[{self.env.now:6.1f}] [ARRIVAL] Job {job.job_id:3d} LLEGA "
-                  f"(Operaciones: {len(job.operations)}, Due date: {job.due_date:.1f})")
+        if VERBOSE:
+            logger.info("[%6.1f] [ARRIVAL] Job %3d LLEGA (Operaciones: %d, Due date: %.1f)",
+                        self.env.now, job.job_id, len(job.operations), job.due_date)
         
         # Notificar a JADE (Mirroring)
         if self.mirroring:
-            notify_event("ORDER_ARRIVED", {
+            self._mirror("ORDER_ARRIVED", {
                 "job_id": job.job_id,
                 "operations": job.operations,
                 "due_date": job.due_date
@@ -182,11 +372,12 @@ class DynamicJobShopSimulator:
             repair_duration=event.repair_duration
         )
         
-        print(f"[{event.failure_time:6.1f}] [FAILURE] Maquina {event.machine_id:2d} FALLO "
-              f"(Reparacion estimada: {event.repair_duration:.1f} u.t.)")
+        if VERBOSE:
+            logger.info("[%6.1f] [FAILURE] Maquina %2d FALLO (Reparacion estimada: %.1f u.t.)",
+                        event.failure_time, event.machine_id, event.repair_duration)
         
         if self.mirroring:
-            notify_event("MACHINE_FAILED", {
+            self._mirror("MACHINE_FAILED", {
                 "machine_id": event.machine_id,
                 "failure_time": event.failure_time,
                 "repair_duration": event.repair_duration
@@ -200,192 +391,240 @@ class DynamicJobShopSimulator:
             total_downtime=event.downtime
         )
         
-        print(f"[{event.repair_end_time:6.1f}] [REPAIR] Maquina {event.machine_id:2d} REPUESTA "
-              f"(Downtime: {event.downtime:.1f} u.t.)")
+        if VERBOSE:
+            logger.info("[%6.1f] [REPAIR] Maquina %2d REPUESTA (Downtime: %.1f u.t.)",
+                        event.repair_end_time, event.machine_id, event.downtime)
 
         if self.mirroring:
-            notify_event("MACHINE_REPAIRED", {
+            self._mirror("MACHINE_REPAIRED", {
                 "machine_id": event.machine_id,
                 "repair_end_time": event.repair_end_time
             })
     
+    def _jade_decide(self, job: JobSpec, machine_id: int,
+                     queue_pos: Dict[int, int], queue_jobs: List[Dict]) -> Tuple[bool, Optional[int]]:
+        """Consulta a JADE si `job` debe procesarse ahora (proceso SimPy).
+        
+        La consulta no bloquea la simulación: otras máquinas pueden emitir
+        sus solicitudes en el mismo instante mientras se espera la respuesta.
+        
+        Returns:
+            (allowed, selected_action_idx)
+        """
+        allowed = True
+        selected_action_idx = None
+        try:
+            resp = yield self._jade_client.request_decision_async(
+                self.env,
+                machine_id=machine_id,
+                current_job_id=job.job_id,
+                queue_jobs=queue_jobs
+            )
+            if isinstance(resp, dict):
+                if 'allow' in resp:
+                    allowed = bool(resp['allow'])
+                if 'selected_job' in resp:
+                    selected_job_id = int(resp['selected_job'])
+                    selected_action_idx = queue_pos.get(selected_job_id)
+                    allowed = (selected_job_id == job.job_id)
+        except Exception:
+            allowed = True
+        return allowed, selected_action_idx
+    
+    def _queue_snapshot(self, requests: List[OperationRequest]) -> Tuple[Dict[int, int], List[Dict]]:
+        """
+        Construye (posiciones, datos) de los trabajos en cola para consultar a JADE.
+        
+        `queue_pos` mapea job_id -> índice en la cola para resolver en O(1) el
+        trabajo que elige JADE.
+        
+        Solo se usa en modo JADE e incluye únicamente los campos que viajan en
+        el protocolo (job_id, next_op_duration, due_date).
+        """
+        queue_pos = {}
+        queue_jobs = []
+        for idx, request in enumerate(requests):
+            js = request.job
+            queue_pos[js.job_id] = idx
+            queue_jobs.append({
+                'job_id': js.job_id,
+                'due_date': js.due_date,
+                # asumimos la primera operación en la lista como proxy
+                'next_op_duration': js.operations[0][1] if js.operations else None
+            })
+        return queue_pos, queue_jobs
+    
+    def _jade_select(self, machine: DynamicMachine, requests: List[OperationRequest],
+                     queue_pos: Dict[int, int],
+                     queue_jobs: List[Dict]) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Consulta a JADE qué solicitud de la cola se despacha (proceso SimPy).
+        
+        Los candidatos se consultan en orden de llegada hasta que uno sea aceptado.
+        
+        Returns:
+            (índice elegido o None si JADE rechaza a todos, selected_action_idx)
+        """
+        # JADE debe ver el estado espejado al día antes de decidir
+        self.flush_mirror()
+        for idx, request in enumerate(requests):
+            allowed, selected_action_idx = yield from self._jade_decide(
+                request.job, machine.id, queue_pos, queue_jobs
+            )
+            if selected_action_idx is not None:
+                return selected_action_idx, selected_action_idx
+            if allowed:
+                return idx, None
+        return None, None
+    
+    def _machine_dispatcher(self, machine: DynamicMachine):
+        """
+        Proceso despachador de una máquina en modo JADE.
+        
+        Espera solicitudes en `machine.store`, consulta a JADE una sola vez
+        por cada hueco libre y ejecuta la operación elegida.
+        """
+        store = machine.store
+        while True:
+            # Esperar al menos una solicitud y devolverla a la cabeza de la cola
+            first = yield store.get()
+            store.items.insert(0, first)
+            
+            requests = list(store.items)
+            queue_pos, queue_jobs = self._queue_snapshot(requests)
+            chosen_idx, selected_action_idx = yield from self._jade_select(
+                machine, requests, queue_pos, queue_jobs
+            )
+            if chosen_idx is None:
+                # JADE rechazó a todos: reintentar tras una espera acotada
+                yield self.env.timeout(0.1)
+                continue
+            
+            request = store.items.pop(chosen_idx)
+            with machine.resource.request() as req:
+                yield req
+                yield from self._execute_operation(
+                    machine, request.job, request.op_idx, request.duration,
+                    queue_jobs, selected_action_idx
+                )
+            request.done.succeed()
+    
+    def _execute_operation(self, machine: DynamicMachine, job: JobSpec, op_idx: int,
+                           duration: float, queue_jobs: Optional[List[Dict]],
+                           selected_action_idx: Optional[int]):
+        """Ejecuta la operación despachada, registrando eventos y feedback."""
+        env = self.env
+        em = self.event_manager
+        mirror = self._mirror if self.mirroring else None
+        machine_id = machine.id
+        job_id = job.job_id
+        
+        # Registrar inicio
+        start_time = env.now
+        em.operation_start(
+            time=start_time,
+            job_id=job_id,
+            machine_id=machine_id,
+            duration=duration,
+            queue_length=machine.queue_length
+        )
+
+        if mirror is not None:
+            mirror("MACHINE_STARTED", {
+                "machine_id": machine_id,
+                "job_id": job_id,
+                "start_time": start_time,
+                "duration": duration
+            })
+
+        if VERBOSE:
+            logger.info("[%6.1f] [START] Job %3d Op%d en Maq %2d (%s u.t.) [Cola: %d]",
+                        start_time, job_id, op_idx + 1, machine_id,
+                        duration, machine.queue_length)
+
+        # Procesar
+        yield env.process(machine.process(job_id, duration))
+
+        # Registrar fin
+        end_time = env.now
+        em.operation_end(
+            time=end_time,
+            job_id=job_id,
+            machine_id=machine_id
+        )
+
+        if mirror is not None:
+            mirror("MACHINE_FINISHED", {
+                "machine_id": machine_id,
+                "job_id": job_id,
+                "end_time": end_time
+            })
+
+        # --- Enviar feedback a JADE (Q-learning) ---
+        if self._send_feedback:
+            # El estado compacto (min/mean/max de la cola) lo reconstruye Java
+            # a partir de `queue_jobs`; aquí no se envía next_state.
+            # Acción: usar selected_action_idx si está disponible, sino intentar calcular
+            action = selected_action_idx if selected_action_idx is not None else 0
+            lateness = end_time - job.due_date
+            reward = -lateness if lateness > 0.0 else 0.0
+            # next_actions: índices disponibles en la cola tras la operación
+            next_actions = list(range(machine.queue_length))
+            self._jade_client.send_feedback(
+                machine_id=machine_id,
+                current_job_id=job_id,
+                queue_jobs=queue_jobs,
+                action=action,
+                reward=reward,
+                next_state=None,
+                next_actions=next_actions
+            )
+    
+    def _run_operation_jade(self, machine: DynamicMachine, job: JobSpec,
+                            op_idx: int, duration: float, priority: float):
+        """Encola la operación y espera a que el despachador JADE la ejecute."""
+        request = OperationRequest(job, op_idx, duration, self.env.event())
+        yield machine.store.put(request)
+        yield request.done
+    
+    def _run_operation_rule(self, machine: DynamicMachine, job: JobSpec,
+                            op_idx: int, duration: float, priority: float):
+        """Ejecuta la operación; la regla se resuelve en la cola de prioridad del recurso."""
+        with machine.resource.request(priority=priority) as req:
+            yield req
+            yield from self._execute_operation(
+                machine, job, op_idx, duration, None, None
+            )
+    
     def _process_job(self, job: JobSpec):
         """Procesa todas las operaciones de un trabajo."""
+        env = self.env
+        machines = self.machines
+        run_operation = self._run_operation
+        
         self.jobs_in_progress[job.job_id] = job
+        # Prioridad del trabajo según la regla (menor = antes); empates FIFO
+        priority = self._priority_key(job.operations, job.due_date)
         
         for op_idx, (machine_id, duration) in enumerate(job.operations):
-            machine = self.machines[machine_id]
-            # Intentar despacho consultando al agente externo (JADE) con fallback local
-            while True:
-                # Añadir a cola si no está
-                if job.job_id not in machine.queue:
-                    machine.queue.append(job.job_id)
-
-                queue_length = len(machine.queue)
-
-                # Solicitar máquina
-                with machine.resource.request() as req:
-                    yield req
-
-                    # Construir snapshot de cola para la decisión (sin remover aun)
-                    queue_job_ids = list(machine.queue)
-                    
-                    queue_jobs = []
-                    for jid in queue_job_ids:
-                        js = self.jobs_in_progress.get(jid)
-                        if js is None:
-                            js = next((pj for pj in self.pending_jobs if pj.job_id == jid), None)
-                        if js is None:
-                            queue_jobs.append({'job_id': jid, 'operations': [], 'due_date': None})
-                        else:
-                            # prox op duration (si existe)
-                            next_op_dur = None
-                            if js.operations:
-                                # asumimos la primera operación en la lista como proxy
-                                next_op_dur = js.operations[0][1]
-                            queue_jobs.append({
-                                'job_id': js.job_id,
-                                'operations': js.operations,
-                                'due_date': getattr(js, 'due_date', None),
-                                'next_op_duration': next_op_dur
-                            })
-
-                    # Consultar decision
-                    selected_job_id = None
-                    selected_action_idx = None
-                    allowed = True
-                    
-                    if self.scheduling_rule == "JADE":
-                        try:
-                            resp = request_decision(
-                                machine_id=machine_id,
-                                current_job_id=job.job_id,
-                                queue_jobs=queue_jobs
-                            )
-                            if isinstance(resp, dict):
-                                if 'allow' in resp:
-                                    allowed = bool(resp['allow'])
-                                if 'selected_job' in resp:
-                                    selected_job_id = int(resp['selected_job'])
-                                    if selected_job_id in queue_job_ids:
-                                        selected_action_idx = queue_job_ids.index(selected_job_id)
-                                    allowed = (selected_job_id == job.job_id)
-                        except Exception:
-                            allowed = True
-                    else:
-                        # Heuristic logic
-                        jobs_data = [j.get('operations', []) for j in queue_jobs]
-                        job_ids = [j['job_id'] for j in queue_jobs]
-                        due_dates = {i: j['due_date'] for i, j in enumerate(queue_jobs)}
-                        
-                        try:
-                            ordered_indices, _ = SchedulingRules.apply_rule(self.scheduling_rule, jobs_data, due_dates)
-                        except Exception:
-                            ordered_indices = SchedulingRules.SPT(jobs_data)
-                        
-                        if ordered_indices:
-                            first_job_id = job_ids[ordered_indices[0]]
-                            allowed = (first_job_id == job.job_id)
-
-                    if not allowed:
-                        # Release and retry (fall through to yield timeout)
-                        pass
-                    else:
-                        # Allowed!
-                        # Remover de cola
-                        if job.job_id in machine.queue:
-                            machine.queue.remove(job.job_id)
-                        
-                        # Registrar inicio
-                        start_time = self.env.now
-                        self.event_manager.operation_start(
-                            time=start_time,
-                            job_id=job.job_id,
-                            machine_id=machine_id,
-                            duration=duration,
-                            queue_length=len(machine.queue)
-                        )
-
-                        if self.mirroring:
-                            notify_event("MACHINE_STARTED", {
-                                "machine_id": machine_id,
-                                "job_id": job.job_id,
-                                "start_time": start_time,
-                                "duration": duration
-                            })
-
-                        # print(f"[{start_time:6.1f}] [START] Job {job.job_id:3d} Op{op_idx+1} en "
-                        #       f"Maq {machine_id:2d} ({duration} u.t.) [Cola: {len(machine.queue)}]")
-
-                        # Procesar
-                        yield self.env.process(machine.process(job.job_id, duration))
-
-                        # Registrar fin
-                        end_time = self.env.now
-                        self.event_manager.operation_end(
-                            time=end_time,
-                            job_id=job.job_id,
-                            machine_id=machine_id
-                        )
-
-                        if self.mirroring:
-                            notify_event("MACHINE_FINISHED", {
-                                "machine_id": machine_id,
-                                "job_id": job.job_id,
-                                "end_time": end_time
-                            })
-
-                        # --- Enviar feedback a JADE (Q-learning) ---
-                        if self.scheduling_rule == "JADE" and self.training:
-                            try:
-                                from .integration.jade_zmq_client import send_feedback
-                            except ImportError:
-                                from integration.jade_zmq_client import send_feedback
-
-                            # Construir representación compacta del estado (misma que Java)
-                            queue_durations = [j.get('next_op_duration', 0.0) for j in queue_jobs]
-                            n = len(queue_durations)
-                            if n > 0:
-                                qmin = min(queue_durations)
-                                qmax = max(queue_durations)
-                                qmean = sum(queue_durations) / n
-                            else:
-                                qmin = qmax = qmean = 0.0
-                            state_str = f"M{machine_id}:len={n}:min={qmin:.2f}:mean={qmean:.2f}:max={qmax:.2f}"
-                            # Acción: usar selected_action_idx si está disponible, sino intentar calcular
-                            action = selected_action_idx if selected_action_idx is not None else 0
-                            reward = -max(0, end_time - job.due_date)
-                            # next_actions: índices disponibles en la cola tras la operación
-                            next_actions = list(range(len(machine.queue)))
-                            send_feedback(
-                                machine_id=machine_id,
-                                current_job_id=job.job_id,
-                                queue_jobs=queue_jobs,
-                                action=action,
-                                reward=reward,
-                                next_state=None,
-                                next_actions=next_actions
-                            )
-                        
-                        break # Exit while True
-
-                # If we are here, we were not allowed. Wait and retry.
-                yield self.env.timeout(0.1)
-
-
+            yield from run_operation(machines[machine_id], job, op_idx, duration, priority)
         
         # Trabajo completado
-        completion_time = self.env.now
+        completion_time = env.now
         makespan = completion_time - job.arrival_time
         
-        self.jobs_completed[job.job_id] = {
-            'job_id': job.job_id,
-            'arrival_time': job.arrival_time,
-            'completion_time': completion_time,
-            'makespan': makespan,
-            'due_date': job.due_date,
-            'tardiness': max(0, completion_time - job.due_date)
-        }
+        tardiness = completion_time - job.due_date
+        if tardiness < 0.0:
+            tardiness = 0.0
+        self.jobs_completed[job.job_id] = JobResult(
+            job.job_id, job.arrival_time, completion_time,
+            makespan, job.due_date, tardiness
+        )
+        self._num_completed += 1
+        self._sum_makespan += makespan
+        self._sum_tardiness += tardiness
+        if tardiness > 0:
+            self._num_late += 1
         
         # Registrar completación
         self.event_manager.job_complete(
@@ -395,16 +634,15 @@ class DynamicJobShopSimulator:
         )
         
         if self.mirroring:
-            notify_event("JOB_COMPLETED", {
+            self._mirror("JOB_COMPLETED", {
                 "job_id": job.job_id,
                 "completion_time": completion_time
             })
 
-        if True:  # verbose
-            tardiness = max(0, completion_time - job.due_date)
+        if VERBOSE:
             status = "[OK]" if tardiness <= 0 else "[LATE]"
-            # print(f"[{completion_time:6.1f}] {status} Job {job.job_id:3d} COMPLETO "
-            #       f"(Makespan: {makespan:.1f}, Tardanza: {tardiness:.1f})")
+            logger.info("[%6.1f] %s Job %3d COMPLETO (Makespan: %.1f, Tardanza: %.1f)",
+                        completion_time, status, job.job_id, makespan, tardiness)
         
         del self.jobs_in_progress[job.job_id]
     
@@ -431,6 +669,11 @@ class DynamicJobShopSimulator:
         
         # Ejecutar
         self.env.run(until=until_time)
+        self.flush_mirror()
+        
+        # Volcar las trazas acumuladas antes de imprimir el resumen
+        for handler in logging.getLogger().handlers:
+            handler.flush()
         
         # Resumen
         self._print_summary(warmup)
@@ -445,15 +688,12 @@ class DynamicJobShopSimulator:
         self.event_manager.print_event_summary()
         
         # Trabajos
-        print(f"[OK] Trabajos completados: {len(self.jobs_completed)}")
+        print(f"[OK] Trabajos completados: {self._num_completed}")
         
-        if self.jobs_completed:
-            makespans = [j['makespan'] for j in self.jobs_completed.values()]
-            tardiness = [j['tardiness'] for j in self.jobs_completed.values()]
-            
-            print(f"   Makespan promedio: {np.mean(makespans):.2f}")
-            print(f"   Tardanza total: {sum(tardiness):.2f}")
-            print(f"   Trabajos atrasados: {len([t for t in tardiness if t > 0])}")
+        if self._num_completed:
+            print(f"   Makespan promedio: {self._sum_makespan / self._num_completed:.2f}")
+            print(f"   Tardanza total: {self._sum_tardiness:.2f}")
+            print(f"   Trabajos atrasados: {self._num_late}")
         
         # Máquinas
         print("\n[ESTADISTICAS POR MAQUINA]:")
@@ -479,37 +719,29 @@ class DynamicJobShopSimulator:
             prefix: Prefijo base del archivo
             rule_name: Nombre de la regla de scheduling (SPT, EDD, LPT, etc.) para incluir en el nombre
         """
+        from datetime import datetime
+        
         # Construir sufijo con nombre de regla si existe
         suffix = f"_{rule_name}" if rule_name else ""
         
+        # Una marca de tiempo para todos los archivos de esta exportación
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
         # Log de eventos
-        log_file = self.event_manager.export_to_csv(f"{prefix}{suffix}")
+        log_file = self.event_manager.export_to_csv(f"{prefix}{suffix}", timestamp=timestamp)
         
         # Trabajos completados
         if self.jobs_completed:
-            df_jobs = pd.DataFrame(list(self.jobs_completed.values()))
             jobs_file = os.path.join(self.event_manager.output_dir, 
-                                     f"{prefix}{suffix}_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
-            df_jobs.to_csv(jobs_file, index=False)
+                                     f"{prefix}{suffix}_jobs_{timestamp}.csv")
+            write_csv(self.jobs_table, jobs_file)
             print(f"✅ Trabajos exportados: {jobs_file}")
         
         # Fallos de máquinas
-        failure_events = self.failure_manager.get_all_failure_events()
-        if failure_events:
-            df_failures = pd.DataFrame([
-                {
-                    'machine_id': e.machine_id,
-                    'failure_time': e.failure_time,
-                    'repair_start': e.repair_start_time,
-                    'repair_duration': e.repair_duration,
-                    'repair_end': e.repair_end_time,
-                    'total_downtime': e.downtime
-                }
-                for e in failure_events
-            ])
+        if self.failure_manager.failure_events:
             failures_file = os.path.join(self.event_manager.output_dir,
-                                         f"{prefix}{suffix}_failures_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
-            df_failures.to_csv(failures_file, index=False)
+                                         f"{prefix}{suffix}_failures_{timestamp}.csv")
+            write_csv(self.failure_manager.failure_table, failures_file)
             print(f"✅ Fallos exportados: {failures_file}")
         
         return log_file
@@ -521,6 +753,16 @@ class DynamicJobShopSimulator:
 
 def main():
     """Ejecuta simulación dinámica de prueba."""
+    if VERBOSE:
+        # Acumular trazas y escribirlas a stdout en bloques
+        target = logging.StreamHandler(sys.stdout)
+        target.setFormatter(logging.Formatter("%(message)s"))
+        handler = logging.handlers.MemoryHandler(
+            capacity=1000, flushLevel=logging.WARNING, target=target
+        )
+        logging.basicConfig(level=logging.INFO, handlers=[handler])
+    else:
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
     parser = argparse.ArgumentParser(description="Ejecutar simulador dinámico Job Shop")
     parser.add_argument("--mode", choices=["phase1", "phase2"], default="phase2",
                         help="Modo de ejecución: phase1 (Mirroring/SPT) o phase2 (Control JADE)")
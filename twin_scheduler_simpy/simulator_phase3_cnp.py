@@ -13,33 +13,59 @@ en vez de SchedulerAgent centralizado.
 """
 
 import simpy
-import pandas as pd
 import os
+import sys
 import argparse
+import logging
+import logging.handlers
+import queue
 from datetime import datetime
 from typing import List, Tuple, Dict, Optional
 import numpy as np
 
-# Imports módulos del proyecto
-try:
-    from .arrival_generator import ArrivalGenerator, JobSpec
+# Imports módulos del proyecto: relativos si se importa como paquete,
+# directos si se ejecuta como script desde este directorio
+if __package__:
+    from .arrival_generator import ArrivalGenerator
     from .machine_failures import MachineFailureManager, MachineFailureEvent, ReliabilityProfile
-    from .event_manager import EventManager, EventType, SimulationEvent
-    from .integration.jade_cnp_client import get_cnp_client, JADECNPClient
-except ImportError:
-    from arrival_generator import ArrivalGenerator, JobSpec
+    from .event_manager import EventManager
+    from .csv_export import write_csv
+else:
+    from arrival_generator import ArrivalGenerator
     from machine_failures import MachineFailureManager, MachineFailureEvent, ReliabilityProfile
-    from event_manager import EventManager, EventType, SimulationEvent
-    from integration.jade_cnp_client import get_cnp_client, JADECNPClient
-    # Fallback para imports de integración
-    try:
-        import sys
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'integration'))
-        from jade_cnp_client import get_cnp_client, JADECNPClient
-    except Exception as e:
-        print(f"[WARNING] No se pudo importar jade_cnp_client: {e}")
-        get_cnp_client = None
-        JADECNPClient = None
+    from event_manager import EventManager
+    from csv_export import write_csv
+
+
+def _load_cnp_client():
+    """Importa el cliente CNP (pyzmq) solo cuando el simulador lo necesita."""
+    if __package__:
+        from .integration import jade_cnp_client
+    else:
+        from integration import jade_cnp_client
+    return jade_cnp_client
+
+logger = logging.getLogger(__name__)
+
+
+# Vigencia por defecto (u.t.) de las asignaciones CNP cacheadas. 0 = sin caché:
+# cada operación se negocia con JADE. Una caché activa reutiliza la máquina
+# elegida sin nueva negociación (sin pujas ni carga actual), así que es opt-in
+ASSIGNMENT_CACHE_TTL = 0.0
+
+# Capacidad inicial (en trabajos) de la tabla de trabajos; crece al doble
+JOB_TABLE_CAPACITY = 1024
+
+# El directorio de logs se crea una sola vez por proceso
+_LOGS_DIR_READY = False
+
+
+def _ensure_logs():
+    """Crea el directorio logs/ en la primera exportación."""
+    global _LOGS_DIR_READY
+    if not _LOGS_DIR_READY:
+        os.makedirs('logs', exist_ok=True)
+        _LOGS_DIR_READY = True
 
 
 class CNPMachine:
@@ -67,39 +93,42 @@ class CNPMachine:
         self.current_op_index = None
     
     def process(self, job_id: int, operation_index: int, duration: float):
-        """Procesa operación, verificando fallos. MEJORA #4: Detecta fallas durante ejecución."""
-        # Si hay fallo al inicio, esperar a que se repare
-        while self.failure_manager.is_machine_failed(self.id):
-            yield self.env.timeout(0.1)
+        """
+        Procesa operación, verificando fallos. MEJORA #4: Detecta fallas durante ejecución.
+        
+        Returns:
+            (completada, tiempo_transcurrido): completada es False si la máquina
+            falló durante la operación
+        """
+        env = self.env
+        fm = self.failure_manager
+        machine_id = self.id
+        bit = 1 << machine_id
+        # Si hay fallo al inicio, esperar el evento de reparación
+        while fm.failed_mask & bit:
+            yield fm.wait_repair(machine_id)
         
         self.current_job_id = job_id
         self.current_op_index = operation_index
         
-        # MEJORA #4: Verificar fallas durante la ejecución
-        start_time = self.env.now
-        elapsed = 0.0
-        check_interval = min(1.0, duration / 10)  # Verificar cada 1s o cada 10% de duración
+        # MEJORA #4: la operación completa compite con la próxima falla de la máquina
+        start_time = env.now
+        yield env.timeout(duration) | fm.wait_failure(machine_id)
         
-        while elapsed < duration:
-            # Procesar en intervalos pequeños
-            next_check = min(check_interval, duration - elapsed)
-            yield self.env.timeout(next_check)
-            elapsed += next_check
-            
-            # Verificar si la máquina falló durante el procesamiento
-            if self.failure_manager.is_machine_failed(self.id):
-                print(f"[FAILURE] Machine {self.id} falló durante Job {job_id} op {operation_index} (progreso: {elapsed:.2f}/{duration:.2f})")
-                # Limpiar estado y propagar falla
-                self.current_job_id = None
-                self.current_op_index = None
-                # Lanzar excepción para que el caller maneje la re-negociación
-                raise RuntimeError(f"MachineFailure:M{self.id}:Job{job_id}:Op{operation_index}")
+        elapsed = env.now - start_time
+        self.current_job_id = None
+        self.current_op_index = None
+        
+        if fm.failed_mask & bit:
+            logger.info("[FAILURE] Machine %d falló durante Job %d op %d (progreso: %.2f/%.2f)",
+                        machine_id, job_id, operation_index, elapsed, duration)
+            # El caller maneja la re-negociación
+            return False, elapsed
         
         # Operación completada exitosamente
         self.total_processing_time += duration
         self.num_operations += 1
-        self.current_job_id = None
-        self.current_op_index = None
+        return True, elapsed
 
 
 class CNPJobShopSimulator:
@@ -111,7 +140,8 @@ class CNPJobShopSimulator:
                  mtbf: float = 100.0,
                  mttr: float = 5.0,
                  random_seed: int = 42,
-                 jade_server: str = "tcp://localhost:5555"):
+                 jade_server: str = "tcp://localhost:5555",
+                 assignment_cache_ttl: float = ASSIGNMENT_CACHE_TTL):
         """
         Args:
             env: Entorno SimPy
@@ -121,27 +151,31 @@ class CNPJobShopSimulator:
             mttr: Mean Time To Repair
             random_seed: Seed para reproducibilidad
             jade_server: Dirección servidor JADE ZeroMQ
+            assignment_cache_ttl: Vigencia (u.t.) de una asignación CNP reutilizable
+                para el mismo tipo y conjunto de máquinas disponibles. Por defecto 0
+                (desactivada); con caché, las operaciones reutilizadas no pasan por CNP
         """
         self.env = env
         self.num_machines = num_machines
         self.random_seed = random_seed
+        # Marca de tiempo de la corrida, usada en los nombres de los archivos exportados
+        self._run_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Cliente CNP para comunicación con JADE
-        try:
-            self.cnp_client = get_cnp_client(jade_server) if get_cnp_client else None
-            if self.cnp_client:
-                print(f"[CNP] Cliente conectado a {jade_server}")
-            else:
-                print("[WARNING] Cliente CNP no disponible, modo simulación sin JADE")
-        except Exception as e:
-            print(f"[ERROR] No se pudo conectar cliente CNP: {e}")
-            self.cnp_client = None
+        # Generador propio (no toca el estado global de numpy/random): llegadas,
+        # operaciones y fallas salen de la misma semilla
+        self._rng = np.random.default_rng(random_seed)
+        
+        # Cliente CNP para comunicación con JADE (se crea en el primer uso)
+        self.jade_server = jade_server
+        self._cnp_client = None
+        self._cnp_client_loaded = False
         
         # Generador de llegadas
         self.arrival_gen = ArrivalGenerator(
             env=env,
             arrival_rate=arrival_rate,
-            num_machines=num_machines
+            num_machines=num_machines,
+            rng=self._rng
         )
         
         # Gestor de fallas de máquinas
@@ -149,17 +183,37 @@ class CNPJobShopSimulator:
             env=env,
             num_machines=num_machines,
             mtbf_mean=mtbf,
-            mttr_mean=mttr
+            mttr_mean=mttr,
+            rng=self._rng
         )
         
         # Crear máquinas
         self.machines = [CNPMachine(env, i, self.failure_manager) for i in range(num_machines)]
         
+        # Máquinas por tipo (fijo); las que están en falla se leen de la máscara
+        # de bits del gestor de fallas
+        self.machines_by_type: Dict[int, List[int]] = {}
+        for m in self.machines:
+            self.machines_by_type.setdefault(m.id, []).append(m.id)
+        
+        # Asignaciones CNP recientes: (tipo, disponibles) -> (machine_id, tiempo)
+        self.assignment_cache_ttl = assignment_cache_ttl
+        self._assign_cache: Dict[Tuple[int, frozenset], Tuple[int, float]] = {}
+        self.failure_manager.set_on_failure_callback(self._on_machine_failure)
+        self.failure_manager.set_on_repair_callback(self._on_machine_repair)
+        
         # Gestor de eventos
         self.event_manager = EventManager()
         
         # Estructuras de datos
-        self.jobs = {}  # jobId -> JobSpec
+        # Tabla de trabajos indexada por job_id: operaciones (tipo de máquina y
+        # duración por fila), cantidad de operaciones, llegada y due date
+        max_ops = self.arrival_gen.max_operations
+        self.ops_machine = np.empty((JOB_TABLE_CAPACITY, max_ops), dtype=np.int16)
+        self.ops_duration = np.empty((JOB_TABLE_CAPACITY, max_ops), dtype=np.float32)
+        self.ops_count = np.zeros(JOB_TABLE_CAPACITY, dtype=np.int8)
+        self.arrival = np.empty(JOB_TABLE_CAPACITY, dtype=np.float64)
+        self.due = np.empty(JOB_TABLE_CAPACITY, dtype=np.float64)
         self.order_agents = {}  # jobId -> agentId (AID from JADE)
         self.job_completion_times = {}
         self.job_tardiness = {}
@@ -168,6 +222,49 @@ class CNPJobShopSimulator:
         self.next_job_id = 0
         self.completed_jobs = 0
         
+    @property
+    def cnp_client(self):
+        """Cliente CNP, creado al primer acceso (None si JADE no está disponible)."""
+        if not self._cnp_client_loaded:
+            self._cnp_client_loaded = True
+            try:
+                self._cnp_client = _load_cnp_client().get_cnp_client(self.jade_server)
+                print(f"[CNP] Cliente conectado a {self.jade_server}")
+            except ImportError as e:
+                print(f"[WARNING] Cliente CNP no disponible ({e}), modo simulación sin JADE")
+            except Exception as e:
+                print(f"[ERROR] No se pudo conectar cliente CNP: {e}")
+        return self._cnp_client
+    
+    @cnp_client.setter
+    def cnp_client(self, client):
+        self._cnp_client = client
+        self._cnp_client_loaded = True
+    
+    def _on_machine_failure(self, event: MachineFailureEvent):
+        """La máquina deja de estar disponible: invalida sus asignaciones."""
+        self._invalidate_assignments(event.machine_id)
+    
+    def _on_machine_repair(self, event: MachineFailureEvent):
+        """La máquina vuelve a estar disponible: invalida sus asignaciones."""
+        self._invalidate_assignments(event.machine_id)
+    
+    def _invalidate_assignments(self, machine_id: int):
+        """Descarta las asignaciones cacheadas en las que participa la máquina."""
+        if self._assign_cache:
+            self._assign_cache = {
+                key: cached for key, cached in self._assign_cache.items()
+                if machine_id not in key[1] and cached[0] != machine_id
+            }
+    
+    def _available_machines(self, machine_type: int) -> List[int]:
+        """Máquinas del tipo requerido que no están en falla."""
+        candidates = self.machines_by_type.get(machine_type, ())
+        failed_mask = self.failure_manager.failed_mask
+        if not failed_mask:
+            return list(candidates)
+        return [mid for mid in candidates if not failed_mask >> mid & 1]
+    
     def run(self, duration: float):
         """Ejecuta simulación por tiempo especificado."""
         print(f"\n[SIMULATION] Iniciando Fase 3 (CNP) - Duración: {duration} u.t.")
@@ -187,35 +284,35 @@ class CNPJobShopSimulator:
         
     def arrival_process(self):
         """Proceso de llegada de jobs con creación de OrderAgents."""
+        env = self.env
+        timeout = env.timeout
+        process = env.process
+        arrival_gen = self.arrival_gen
+        em = self.event_manager
         while True:
-            # Esperar siguiente llegada (distribución exponencial)
-            interarrival_time = np.random.exponential(1.0 / self.arrival_gen.arrival_rate)
-            yield self.env.timeout(interarrival_time)
+            # Esperar siguiente llegada (exponencial, del bloque pre-muestreado)
+            interarrival_time = arrival_gen.next_inter_arrival()
+            yield timeout(interarrival_time)
             
             # Generar nuevo job usando arrival_gen
             job_id = self.next_job_id
-            operations_list = self.arrival_gen.generate_job_operations()
-            arrival_time = self.env.now
-            due_date = self.arrival_gen.calculate_due_date(arrival_time, operations_list)
+            operations_list = arrival_gen.generate_job_operations()
+            now = env.now
+            arrival_time = now
+            due_date = arrival_gen.calculate_due_date(arrival_time, operations_list)
             
-            # Crear JobSpec
-            job_spec = JobSpec(
-                job_id=job_id,
-                arrival_time=arrival_time,
-                operations=operations_list,
-                due_date=due_date
-            )
-            
-            self.jobs[job_id] = job_spec
+            # Registrar en la tabla de trabajos
+            self._store_job(job_id, arrival_time, operations_list, due_date)
             self.next_job_id += 1
             
-            self.event_manager.arrival_event(
-                time=self.env.now,
+            em.arrival_event(
+                time=now,
                 job_id=job_id,
-                num_operations=len(job_spec.operations)
+                num_operations=len(operations_list)
             )
             
-            print(f"[t={self.env.now:.2f}] Job {job_id} arrived (ops={len(job_spec.operations)}, due={job_spec.due_date:.2f})")
+            logger.info("[t=%.2f] Job %d arrived (ops=%d, due=%.2f)",
+                        now, job_id, len(operations_list), due_date)
             
             # Crear OrderAgent en JADE (opcional, solo si cliente disponible)
             if self.cnp_client:
@@ -224,104 +321,143 @@ class CNPJobShopSimulator:
                     operations=[{
                         'machine_type': machine_id,
                         'duration': duration
-                    } for machine_id, duration in job_spec.operations],
-                    due_date=job_spec.due_date,
-                    current_time=self.env.now
+                    } for machine_id, duration in operations_list],
+                    due_date=due_date,
+                    current_time=now
                 )
                 
                 if agent_id:
                     self.order_agents[job_id] = agent_id
-                    print(f"[CNP] OrderAgent '{agent_id}' creado para Job {job_id}")
+                    logger.info("[CNP] OrderAgent '%s' creado para Job %d", agent_id, job_id)
             
             # Iniciar procesamiento del job
-            self.env.process(self.process_job(job_spec))
+            process(self.process_job(job_id))
+    
+    def _store_job(self, job_id: int, arrival_time: float,
+                   operations: List[Tuple[int, int]], due_date: float):
+        """Guarda un trabajo en la tabla, duplicando su capacidad si hace falta."""
+        if job_id >= len(self.due):
+            capacity = 2 * len(self.due)
+            for name in ('ops_machine', 'ops_duration', 'ops_count', 'arrival', 'due'):
+                old = getattr(self, name)
+                grown = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+                grown[:len(old)] = old
+                setattr(self, name, grown)
+        
+        num_ops = len(operations)
+        for op_index, (machine_type, duration) in enumerate(operations):
+            self.ops_machine[job_id, op_index] = machine_type
+            self.ops_duration[job_id, op_index] = duration
+        self.ops_count[job_id] = num_ops
+        self.arrival[job_id] = arrival_time
+        self.due[job_id] = due_date
     
-    def process_job(self, job: JobSpec):
+    def process_job(self, job_id: int):
         """Procesa todas las operaciones de un job usando CNP."""
-        job_id = job.job_id
-        start_time = self.env.now
-        
-        for op_index, (machine_type, duration) in enumerate(job.operations):
+        env = self.env
+        em = self.event_manager
+        machines = self.machines
+        num_ops = int(self.ops_count[job_id])
+        operations = list(zip(self.ops_machine[job_id, :num_ops].tolist(),
+                              self.ops_duration[job_id, :num_ops].tolist()))
+        due_date = float(self.due[job_id])
+        
+        for op_index, (machine_type, duration) in enumerate(operations):
+            
+            # Máquinas disponibles del tipo requerido (si no hay, esperar y reintentar)
+            available_machines = self._available_machines(machine_type)
+            if not available_machines:
+                logger.warning("[WARNING] No hay máquinas tipo %d disponibles", machine_type)
+                yield env.timeout(1.0)
+                available_machines = self._available_machines(machine_type)
             
             # Negociar asignación via CNP (fallback a asignación directa si no hay JADE)
-            assigned_machine_id = yield from self.negotiate_assignment(job_id, op_index, machine_type, duration)
+            assigned_machine_id = self._pick_machine(job_id, op_index, machine_type, available_machines)
             
             if assigned_machine_id is None:
-                print(f"[ERROR] No se pudo asignar Job {job_id} op {op_index}")
+                logger.error("[ERROR] No se pudo asignar Job %d op %d", job_id, op_index)
                 return
             
-            machine = self.machines[assigned_machine_id]
-            
-            # Solicitar máquina
-            with machine.resource.request() as req:
-                yield req
-                
-                # Si la máquina está fallida, el failure_process() ya tiene el recurso bloqueado
-                # El yield req arriba esperará automáticamente hasta que esté disponible
-                
-                # Procesar operación con manejo de fallos
-                op_start = self.env.now
+            # Un intento por máquina asignada; tras una re-negociación exitosa se
+            # reintenta la operación en la nueva máquina sin recursión
+            while True:
+                machine = machines[assigned_machine_id]
+                reassigned_machine_id = None
                 
-                self.event_manager.operation_start(
-                    time=op_start,
-                    job_id=job_id,
-                    machine_id=assigned_machine_id,
-                    duration=duration,
-                    queue_length=0
-                )
-                
-                # Notificar inicio a JADE
-                if self.cnp_client:
-                    self.cnp_client.notify_operation_start(
-                        job_id=job_id,
-                        operation_index=op_index,
-                        machine_id=assigned_machine_id,
-                        start_time=op_start
-                    )
-                
-                print(f"[t={op_start:.2f}] Job {job_id} op {op_index} STARTED on M{assigned_machine_id} (dur={duration:.2f})")
-                
-                # MEJORA #4: Ejecutar operación con manejo de fallas
-                try:
-                    yield from machine.process(job_id, op_index, duration)
+                # Solicitar máquina
+                with machine.resource.request() as req:
+                    yield req
                     
-                    op_end = self.env.now
+                    # Si la máquina está fallida, el failure_process() ya tiene el recurso bloqueado
+                    # El yield req arriba esperará automáticamente hasta que esté disponible
                     
-                    self.event_manager.operation_end(
-                        time=op_end,
+                    # Procesar operación con manejo de fallos
+                    op_start = env.now
+                    
+                    em.operation_start(
+                        time=op_start,
                         job_id=job_id,
-                        machine_id=assigned_machine_id
+                        machine_id=assigned_machine_id,
+                        duration=duration,
+                        queue_length=0
                     )
                     
-                    # Notificar finalización exitosa a JADE
-                    is_last_op = (op_index == len(job.operations) - 1)
+                    # Notificar inicio a JADE (encolado, sin esperar respuesta)
                     if self.cnp_client:
-                        self.cnp_client.notify_operation_complete(
+                        self.cnp_client.notify_operation_start(
                             job_id=job_id,
                             operation_index=op_index,
                             machine_id=assigned_machine_id,
-                            completion_time=op_end,
-                            is_last_operation=is_last_op
+                            start_time=op_start,
+                            wait=False
                         )
                     
-                    print(f"[t={op_end:.2f}] Job {job_id} op {op_index} COMPLETED on M{assigned_machine_id}")
+                    logger.info("[t=%.2f] Job %d op %d STARTED on M%d (dur=%.2f)",
+                                op_start, job_id, op_index, assigned_machine_id, duration)
+                    
+                    # MEJORA #4: Ejecutar operación con manejo de fallas
+                    completed, _ = yield from machine.process(job_id, op_index, duration)
+                    
+                    if completed:
+                        op_end = env.now
+                        
+                        em.operation_end(
+                            time=op_end,
+                            job_id=job_id,
+                            machine_id=assigned_machine_id
+                        )
+                        
+                        # Notificar finalización exitosa a JADE (encolado, sin esperar respuesta)
+                        is_last_op = (op_index == num_ops - 1)
+                        if self.cnp_client:
+                            self.cnp_client.notify_operation_complete(
+                                job_id=job_id,
+                                operation_index=op_index,
+                                machine_id=assigned_machine_id,
+                                completion_time=op_end,
+                                is_last_operation=is_last_op,
+                                wait=False
+                            )
+                        
+                        logger.info("[t=%.2f] Job %d op %d COMPLETED on M%d",
+                                    op_end, job_id, op_index, assigned_machine_id)
                     
-                except RuntimeError as e:
-                    # MEJORA #4: Capturar falla y re-negociar
-                    if str(e).startswith("MachineFailure:"):
-                        failure_time = self.env.now
-                        print(f"[t={failure_time:.2f}] FALLA DETECTADA: {e}")
+                    else:
+                        # MEJORA #4: Falla durante la operación, re-negociar
+                        failure_time = env.now
+                        logger.info("[t=%.2f] FALLA DETECTADA: M%d Job %d op %d",
+                                    failure_time, assigned_machine_id, job_id, op_index)
                         
                         # Notificar falla y solicitar re-negociación a JADE
                         if self.cnp_client:
                             # Obtener máquinas disponibles del mismo tipo
-                            available_machines = [
-                                m.id for m in self.machines
-                                if m.id == machine_type and not self.failure_manager.is_machine_failed(m.id)
-                            ]
+                            available_machines = self._available_machines(machine_type)
                             
-                            print(f"[RENEGOTIATE] Solicitando re-asignación para Job {job_id} op {op_index}")
-                            print(f"[RENEGOTIATE] Máquinas disponibles tipo {machine_type}: {available_machines}")
+                            if logger.isEnabledFor(logging.INFO):
+                                logger.info("[RENEGOTIATE] Solicitando re-asignación para Job %d op %d",
+                                            job_id, op_index)
+                                logger.info("[RENEGOTIATE] Máquinas disponibles tipo %d: %s",
+                                            machine_type, available_machines)
                             
                             new_assignment = self.cnp_client.renegotiate_after_failure(
                                 job_id=job_id,
@@ -332,66 +468,58 @@ class CNPJobShopSimulator:
                             )
                             
                             if new_assignment and new_assignment.get('status') == 'success':
-                                new_machine_id = new_assignment['assignment']['machine_id']
-                                print(f"[RENEGOTIATE] ✓ Re-asignado a M{new_machine_id}, reintentando...")
-                                
-                                # Reintentar operación con nueva máquina
-                                # (recursión para simplificar el código)
-                                yield from self.process_operation(job, job_id, op_index)
+                                reassigned_machine_id = new_assignment['assignment']['machine_id']
+                                logger.info("[RENEGOTIATE] ✓ Re-asignado a M%d, reintentando...",
+                                            reassigned_machine_id)
                             else:
-                                print(f"[ERROR] No se pudo re-asignar Job {job_id} op {op_index} tras falla")
+                                logger.error("[ERROR] No se pudo re-asignar Job %d op %d tras falla", job_id, op_index)
                         else:
-                            print(f"[ERROR] CNP client no disponible para re-negociación")
-                    else:
-                        # Otro tipo de error, re-lanzar
-                        raise
+                            logger.error("[ERROR] CNP client no disponible para re-negociación")
+                
+                if reassigned_machine_id is None:
+                    break
+                # Reintentar la operación en la nueva máquina (recurso anterior ya liberado)
+                assigned_machine_id = reassigned_machine_id
         
         # Job completado
-        completion_time = self.env.now
-        tardiness = max(0, completion_time - job.due_date)
+        completion_time = env.now
+        tardiness = max(0, completion_time - due_date)
         
         self.job_completion_times[job_id] = completion_time
         self.job_tardiness[job_id] = tardiness
         self.completed_jobs += 1
         
-        # EventManager no tiene método job_complete, usamos log_event directamente
-        event = SimulationEvent(
+        em.job_complete_tardiness(
             time=completion_time,
-            event_type=EventType.COMPLETE.value,
             job_id=job_id,
-            additional_info={"tardiness": tardiness}
+            tardiness=tardiness
         )
-        self.event_manager.log_event(event)
         
-        print(f"[t={completion_time:.2f}] Job {job_id} COMPLETED (tardiness={tardiness:.2f})")
+        logger.info("[t=%.2f] Job %d COMPLETED (tardiness=%.2f)", completion_time, job_id, tardiness)
     
-    def negotiate_assignment(self, job_id: int, op_index: int, machine_type: int, duration: float):
-        """Negocia asignación de operación via CNP."""
-        # Obtener máquinas disponibles del tipo requerido
-        available_machines = [
-            m.id for m in self.machines 
-            if m.id == machine_type and not self.failure_manager.is_machine_failed(m.id)
-        ]
-        
-        if not available_machines:
-            print(f"[WARNING] No hay máquinas tipo {machine_type} disponibles")
-            # Esperar y reintentar
-            yield self.env.timeout(1.0)
-            available_machines = [
-                m.id for m in self.machines 
-                if m.id == machine_type and not self.failure_manager.is_machine_failed(m.id)
-            ]
-        
-        # Solicitar negociación CNP a JADE
+    def _pick_machine(self, job_id: int, op_index: int, machine_type: int,
+                      available_machines: List[int]) -> Optional[int]:
+        """Negocia la asignación de una operación via CNP (sin ceder el control a SimPy)."""
+        # Solicitar negociación CNP a JADE (o reutilizar una reciente equivalente)
         if self.cnp_client:
+            now = self.env.now
+            caching = self.assignment_cache_ttl > 0
+            if caching:
+                key = (machine_type, frozenset(available_machines))
+                cached = self._assign_cache.get(key)
+                if cached is not None and now - cached[1] < self.assignment_cache_ttl:
+                    return cached[0]
+            
             assignment = self.cnp_client.request_machine_assignment(
                 job_id=job_id,
                 operation_index=op_index,
-                current_time=self.env.now,
+                current_time=now,
                 available_machines=available_machines
             )
             
             if assignment:
+                if caching:
+                    self._assign_cache[key] = (assignment['machine_id'], now)
                 return assignment['machine_id']
         
         # Fallback: asignar primera máquina disponible
@@ -402,47 +530,50 @@ class CNPJobShopSimulator:
     
     def export_results(self, prefix: str = "simulation_phase3_cnp"):
         """Exporta resultados a CSV."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = self._run_ts
         
         # Crear directorio logs si no existe
-        os.makedirs('logs', exist_ok=True)
+        _ensure_logs()
         
         # Exportar eventos usando el método correcto (solo el prefijo, no el path completo)
-        self.event_manager.export_to_csv(filename=prefix)
+        self.event_manager.export_to_csv(filename=prefix, timestamp=timestamp)
         print(f"\n[EXPORT] Eventos exportados con prefijo: {prefix}")
         
-        # Exportar jobs
-        jobs_data = []
-        for job_id, job_spec in self.jobs.items():
-            if job_id in self.job_completion_times:
-                jobs_data.append({
-                    'job_id': job_id,
-                    'arrival_time': job_spec.arrival_time,
-                    'due_date': job_spec.due_date,
-                    'completion_time': self.job_completion_times[job_id],
-                    'tardiness': self.job_tardiness[job_id],
-                    'num_operations': len(job_spec.operations)
-                })
-        
-        jobs_df = pd.DataFrame(jobs_data)
+        # Exportar jobs (columnas NumPy, sin pasar por un DataFrame)
+        ids = np.array(sorted(self.job_completion_times), dtype=np.int32)
+        n = len(ids)
+        completion = np.fromiter((self.job_completion_times[job_id] for job_id in ids.tolist()),
+                                 dtype=np.float64, count=n)
+        tardiness = np.fromiter((self.job_tardiness[job_id] for job_id in ids.tolist()),
+                                dtype=np.float64, count=n)
+        # Columnas exportadas con tipos reducidos (enteros cortos, tiempos float32)
+        jobs_columns = {
+            'job_id': ids,
+            'arrival_time': self.arrival[ids].astype(np.float32),
+            'due_date': self.due[ids].astype(np.float32),
+            'completion_time': completion.astype(np.float32),
+            'tardiness': tardiness.astype(np.float32),
+            'num_operations': self.ops_count[ids].astype(np.int16),
+        }
+        
         jobs_file = f"logs/{prefix}_jobs_{timestamp}.csv"
-        jobs_df.to_csv(jobs_file, index=False)
+        write_csv(jobs_columns, jobs_file)
         print(f"[EXPORT] Jobs: {jobs_file}")
         
         # Las fallas ya están en el event log, no necesitamos un archivo separado
         
         # Métricas
-        if jobs_data:
-            avg_tardiness = jobs_df['tardiness'].mean()
-            max_tardiness = jobs_df['tardiness'].max()
-            total_tardiness = jobs_df['tardiness'].sum()
-            makespan = jobs_df['completion_time'].max()
+        if n:
+            avg_tardiness = tardiness.mean()
+            max_tardiness = tardiness.max()
+            total_tardiness = tardiness.sum()
+            makespan = completion.max()
             
             print(f"\n[METRICS] Makespan: {makespan:.2f}")
             print(f"[METRICS] Total Tardiness: {total_tardiness:.2f}")
             print(f"[METRICS] Avg Tardiness: {avg_tardiness:.2f}")
             print(f"[METRICS] Max Tardiness: {max_tardiness:.2f}")
-            print(f"[METRICS] Jobs completados: {len(jobs_data)}")
+            print(f"[METRICS] Jobs completados: {n}")
 
 
 def main():
@@ -457,6 +588,13 @@ def main():
     
     args = parser.parse_args()
     
+    # Trazas por evento: el SimPy solo encola registros; un hilo los escribe a stdout
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    logging.basicConfig(level=logging.INFO, format="%(message)s",
+                        handlers=[logging.handlers.QueueHandler(log_queue)])
+    listener.start()
+    
     # Crear entorno SimPy
     env = simpy.Environment()
     
@@ -480,6 +618,8 @@ def main():
     # Cerrar cliente CNP
     if simulator.cnp_client:
         simulator.cnp_client.close()
+    
+    listener.stop()
 
 
 if __name__ == "__main__":
@@ -13,14 +13,18 @@ Datasets: FT06 (6x6), FT10 (10x10)
 """
 
 import simpy
+import numpy as np
 import pandas as pd
 import os
+from collections import deque
 from datetime import datetime
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 
-from .metrics import MetricsCalculator
+from .metrics import MetricsCalculator, EventBuffer
 from .scheduling_rules import SchedulingRules
 from .datasets import Datasets
+from .csv_export import write_csv
+from .utils.profile import phase
 
 
 class Machine:
@@ -34,18 +38,33 @@ class Machine:
         """
         self.env = env
         self.id = machine_id
-        self.resource = simpy.Resource(env, capacity=1)  # Una operación a la vez
-        self.queue = []  # Buffer de trabajos esperando
+        # Capacidad 1: cola FIFO propia de eventos en lugar de simpy.Resource
+        # (sin la maquinaria de request/put/get ni prioridades)
+        self.busy = False
+        self.queue = deque()
     
-    def process(self, job_id: int, duration: int):
+    def acquire(self) -> Optional[simpy.Event]:
         """
-        Procesa una operación durante `duration` unidades de tiempo.
+        Reserva la máquina.
         
-        Args:
-            job_id: ID del trabajo
-            duration: Duración de la operación en unidades de tiempo
+        Returns:
+            None si la máquina estaba libre (reservada de inmediato); si no,
+            un evento que se dispara cuando la máquina pasa a este trabajo
         """
-        yield self.env.timeout(duration)
+        if not self.busy:
+            self.busy = True
+            return None
+        ev = self.env.event()
+        self.queue.append(ev)
+        return ev
+    
+    def release(self):
+        """Libera la máquina o la cede directamente al siguiente en la cola."""
+        if self.queue:
+            # Sigue ocupada: el turno pasa al primer trabajo en espera
+            self.queue.popleft().succeed()
+        else:
+            self.busy = False
 
 
 class Job:
@@ -64,7 +83,7 @@ class Job:
 
 
 def job_process(env: simpy.Environment, job: Job, machines: List[Machine], 
-                log: List[List], verbose: bool = True):
+                log: EventBuffer, verbose: bool = True):
     """
     Simula todas las operaciones de un job en secuencia.
     
@@ -72,7 +91,7 @@ def job_process(env: simpy.Environment, job: Job, machines: List[Machine],
         env: Entorno SimPy
         job: Objeto Job a procesar
         machines: Lista de máquinas disponibles
-        log: Lista para registrar eventos [time, event, job, machine]
+        log: Buffer columnar de eventos (time, event, job, machine)
         verbose: Si True, imprime eventos
     """
     job.arrival_time = env.now
@@ -80,33 +99,28 @@ def job_process(env: simpy.Environment, job: Job, machines: List[Machine],
     for op_idx, (machine_id, duration) in enumerate(job.operations):
         machine = machines[machine_id]
         
-        # Agregar a la cola de la máquina
-        machine.queue.append(job.id)
+        # Solicitar acceso a la máquina (la espera queda en machine.queue)
+        wait = machine.acquire()
+        if wait is not None:
+            yield wait
+        
+        log.append(env.now, EventBuffer.START, job.id, machine_id)
+        
+        if verbose:
+            queue_size = len(machine.queue)
+            print(f"[{env.now:6.1f}] [START] Job {job.id:2d} Op {op_idx} Maq {machine_id} "
+                  f"({duration} u.t.) [Cola: {queue_size}]")
+        
+        # Procesar
+        yield env.timeout(duration)
+        
+        # Registrar finalización
+        log.append(env.now, EventBuffer.FINISH, job.id, machine_id)
         
-        # Solicitar acceso a la máquina
-        with machine.resource.request() as req:
-            yield req
-            
-            # Remover de la cola
-            if job.id in machine.queue:
-                machine.queue.remove(job.id)
-            
-            start_time = env.now
-            log.append([env.now, "start", job.id, machine_id])
-            
-            if verbose:
-                queue_size = len(machine.queue)
-                print(f"[{env.now:6.1f}] [START] Job {job.id:2d} Op {op_idx} Maq {machine_id} "
-                      f"({duration} u.t.) [Cola: {queue_size}]")
-            
-            # Procesar
-            yield env.process(machine.process(job.id, duration))
-            
-            # Registrar finalización
-            log.append([env.now, "finish", job.id, machine_id])
-            
-            if verbose:
-                print(f"[{env.now:6.1f}] [FINISH] Job {job.id:2d} Op {op_idx} Maq {machine_id} completada")
+        if verbose:
+            print(f"[{env.now:6.1f}] [FINISH] Job {job.id:2d} Op {op_idx} Maq {machine_id} completada")
+        
+        machine.release()
     
     job.completion_time = env.now
 
@@ -116,7 +130,9 @@ def run_simulation(jobs_data: List[List[Tuple[int, int]]],
                   rule: str = "SPT",
                   dataset_name: str = "",
                   verbose: bool = True,
-                  export_log: bool = True) -> Dict:
+                  export_log: bool = True,
+                  num_machines: Optional[int] = None,
+                  show_schedule: bool = True) -> Dict:
     """
     Ejecuta una simulación del Job Shop.
     
@@ -127,32 +143,39 @@ def run_simulation(jobs_data: List[List[Tuple[int, int]]],
         dataset_name: Nombre del dataset (para reportes)
         verbose: Si True, imprime eventos de simulación
         export_log: Si True, exporta log a CSV
+        num_machines: Número de máquinas ya calculado (se deduce de jobs_data si es None)
+        show_schedule: Si True, imprime el orden de despacho de la regla
     
     Returns:
-        Diccionario con métricas de la simulación
+        Diccionario con rule, dataset, metrics, jobs_completed y log. `log` es
+        un EventBuffer (columnas time, event, job, machine), no una lista de
+        filas; log.to_rows() da las filas [time, event, job, machine]
     """
     
     # === CREAR ENTORNO ===
     env = simpy.Environment()
     
     # === APLICAR REGLA DE DESPACHO ===
-    ordered_indices, rule_desc = SchedulingRules.apply_rule(rule, jobs_data, due_dates)
+    with phase("rules"):
+        ordered_indices, rule_desc = SchedulingRules.apply_rule(rule, jobs_data, due_dates)
     
     # Reordenar trabajos según la regla
     ordered_jobs = [jobs_data[i] for i in ordered_indices]
     
     # Mostrar información de la regla
-    SchedulingRules.print_schedule(rule, ordered_indices, jobs_data, due_dates)
+    if show_schedule:
+        SchedulingRules.print_schedule(rule, ordered_indices, jobs_data, due_dates)
     
     # === CREAR MÁQUINAS ===
-    num_machines = len(set(m for job in jobs_data for m, _ in job))
+    if num_machines is None:
+        num_machines = len(set(m for job in jobs_data for m, _ in job))
     machines = [Machine(env, i) for i in range(num_machines)]
     
     # === CREAR TRABAJOS ===
     jobs = [Job(ordered_indices[i], ordered_jobs[i]) for i in range(len(ordered_jobs))]
     
     # === EVENTO LOG ===
-    log = []
+    log = EventBuffer()
     
     # === INICIAR PROCESOS ===
     print(f"\n{'='*70}")
@@ -163,18 +186,22 @@ def run_simulation(jobs_data: List[List[Tuple[int, int]]],
         env.process(job_process(env, job, machines, log, verbose=verbose))
     
     # === EJECUTAR SIMULACIÓN ===
-    env.run()
+    with phase("simulate"):
+        env.run()
     
     # === CALCULAR MÉTRICAS ===
-    metrics_calc = MetricsCalculator(log, jobs_data, due_dates)
-    metrics = metrics_calc.print_metrics(rule_name=rule)
+    with phase("metrics"):
+        metrics_calc = MetricsCalculator(log, jobs_data, due_dates)
+        metrics = metrics_calc.print_metrics(rule_name=rule)
     
     # === EXPORTAR LOG ===
     if export_log:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_filename = f"simulation_log_{rule}_{timestamp}.csv"
-        df = pd.DataFrame(log, columns=["time", "event", "job", "machine"])
-        df.to_csv(log_filename, index=False)
+        # Con duraciones enteras los tiempos son enteros: exportarlos sin decimales
+        integer_times = all(isinstance(d, (int, np.integer)) for job in jobs_data for _, d in job)
+        with phase("export"):
+            write_csv(log.to_columns(integer_times), log_filename)
         print(f"[INFO] Log exportado a: {log_filename}\n")
     
     # === RETORNAR RESULTADOS ===
@@ -189,18 +216,21 @@ def run_simulation(jobs_data: List[List[Tuple[int, int]]],
     return results
 
 
-def run_validation(dataset_name: str = "FT06", verbose: bool = False):
+def run_validation(dataset_name: str = "FT06", verbose: bool = False,
+                   export_logs: bool = True):
     """
     Ejecuta validación comparativa del simulador con múltiples reglas.
     
     Args:
         dataset_name: Nombre del dataset a usar
-        verbose: Si True, muestra detalles de la simulación
+        verbose: Si True, muestra detalles de la simulación y el orden de cada regla
+        export_logs: Si False, solo se guarda el CSV comparativo (sin logs por regla)
     """
     
     # === CARGAR DATASET ===
     try:
-        jobs_data, due_dates = Datasets.load_dataset(dataset_name)
+        with phase("parse"):
+            jobs_data, due_dates = Datasets.load_dataset(dataset_name)
     except ValueError as e:
         print(f"[ERROR] {e}")
         print(f"Datasets disponibles: {', '.join(Datasets.get_available_datasets().keys())}")
@@ -213,6 +243,9 @@ def run_validation(dataset_name: str = "FT06", verbose: bool = False):
     rules = ["SPT", "EDD", "LPT"]
     results = []
     
+    # Invariantes del dataset: se calculan una vez para todas las reglas
+    num_machines = len(set(m for job in jobs_data for m, _ in job))
+    
     print(f"\n{'='*70}")
     print("[VALIDATION] BASE SIMULATOR VALIDATION")
     print(f"{'='*70}\n")
@@ -228,7 +261,9 @@ def run_validation(dataset_name: str = "FT06", verbose: bool = False):
             rule=rule,
             dataset_name=dataset_name,
             verbose=verbose,
-            export_log=True
+            export_log=export_logs,
+            num_machines=num_machines,
+            show_schedule=verbose
         )
         
         results.append(result)
@@ -257,7 +292,8 @@ def run_validation(dataset_name: str = "FT06", verbose: bool = False):
     # === GUARDAR RESULTADOS ===
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     results_filename = f"validation_results_{dataset_name}_{timestamp}.csv"
-    df_comparison.to_csv(results_filename, index=False)
+    with phase("export"):
+        df_comparison.to_csv(results_filename, index=False)
     print(f"[INFO] Resultados guardados en: {results_filename}\n")
     
     return results
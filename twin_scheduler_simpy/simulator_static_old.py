@@ -1,4 +1,8 @@
+import array
+import itertools
+
 import simpy
+import numpy as np
 import pandas as pd
 
 class Machine:
@@ -14,26 +18,50 @@ class Machine:
 
 
 class Job:
-    """Representa un trabajo que tiene una secuencia de operaciones."""
+    """Representa un trabajo que tiene una secuencia de operaciones.
+
+    Las operaciones se guardan como dos arrays int32 paralelos (máquina y
+    duración de cada operación).
+    """
+    __slots__ = ('id', 'machines', 'durations', 'current_op')
+
     def __init__(self, job_id, operations):
         self.id = job_id
-        self.operations = operations
+        arr = np.asarray(operations, dtype=np.int32).reshape(-1, 2)
+        self.machines = arr[:, 0]
+        self.durations = arr[:, 1]
         self.current_op = 0
 
 
-def job_process(env, job: Job, machines, log):
-    """Simula todas las operaciones de un job."""
-    for (machine_id, duration) in job.operations:
+def job_process(env, job: Job, machines, log, verbose: bool = False):
+    """Simula todas las operaciones de un job (verbose: imprime su finalización).
+
+    log: (contador compartido, times, events, job_ids, machine_ids), columnas
+    pre-dimensionadas en run_simulation; cada evento ocupa la posición
+    siguiente del contador.
+    """
+    counter, times, events, job_ids, machine_ids = log
+    job_id = job.id
+    # Una sola conversión a ints de Python por job (no por evento)
+    for machine_id, duration in zip(job.machines.tolist(), job.durations.tolist()):
         machine = machines[machine_id]
 
         with machine.resource.request() as req:
             yield req
-            start = env.now
-            log.append([env.now, "start", job.id, machine_id])
-            yield env.process(machine.process(job.id, duration))
-            log.append([env.now, "finish", job.id, machine_id])
-
-    print(f"Job {job.id} completado en t={env.now}")
+            i = next(counter)
+            times[i] = env.now
+            events[i] = "start"
+            job_ids[i] = job_id
+            machine_ids[i] = machine_id
+            yield env.process(machine.process(job_id, duration))
+            i = next(counter)
+            times[i] = env.now
+            events[i] = "finish"
+            job_ids[i] = job_id
+            machine_ids[i] = machine_id
+
+    if verbose:
+        print(f"Job {job_id} completado en t={env.now}")
 
 
 def load_ft06():
@@ -55,7 +83,7 @@ def load_ft06():
     return data
 
 
-def run_simulation():
+def run_simulation(verbose: bool = False):
     env = simpy.Environment()
     ft_data = load_ft06()
 
@@ -65,16 +93,35 @@ def run_simulation():
     # Crear jobs
     jobs = [Job(jid, ops) for jid, ops in enumerate(ft_data)]
 
-    log = []
+    # Columnas del log pre-dimensionadas: 2 eventos (start/finish) por operación
+    n_events = 2 * sum(len(job.machines) for job in jobs)
+    counter = itertools.count()
+    # Duraciones enteras (int32 en Job): los tiempos también lo son
+    times = array.array('q', bytes(8 * n_events))
+    events = [None] * n_events
+    job_ids = array.array('i', bytes(4 * n_events))
+    machine_ids = array.array('i', bytes(4 * n_events))
+    log = (counter, times, events, job_ids, machine_ids)
 
     # Iniciar procesos
     for job in jobs:
-        env.process(job_process(env, job, machines, log))
+        env.process(job_process(env, job, machines, log, verbose))
 
     env.run()
 
-    df = pd.DataFrame(log, columns=["time", "event", "job", "machine"])
-    df.to_csv("static_log.csv", index=False)
+    # Columnas tipadas sobre los buffers (sin copia de los enteros); los
+    # eventos se registraron en orden de simulación, ya ordenados por tiempo
+    n = next(counter)
+    df = pd.DataFrame({
+        "time": np.frombuffer(times, dtype=np.int64)[:n],
+        "event": np.array(events[:n], dtype=object),
+        "job": np.frombuffer(job_ids, dtype=np.intc)[:n],
+        "machine": np.frombuffer(machine_ids, dtype=np.intc)[:n],
+    })
+
+    # Escritura por bloques sobre un archivo con buffer de 1 MB
+    with open("static_log.csv", "w", newline="", buffering=1 << 20) as f:
+        df.to_csv(f, index=False, lineterminator="\n", chunksize=100_000)
     print(df.head())
 
 if __name__ == "__main__":
@@ -5,7 +5,7 @@ Proporciona funciones para convertir instancias Taillard en llegadas escalonadas
 (Opción B) que alimentan el simulador dinámico. Permite comparación directa 
 entre Fase 1 (estático) y Fase 2 (dinámico) usando los mismos datos.
 """
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Optional, Union
 import numpy as np
 
 # Intentar imports relativos; si falla, usar imports directos
@@ -16,8 +16,8 @@ except ImportError:
 
 
 def convert_taillard_to_staggered_arrivals(
-    jobs_data: List[List[Tuple[int, int]]],
-    due_dates: Dict[int, float],
+    jobs_data: Union[List[List[Tuple[int, int]]], np.ndarray],
+    due_dates: Union[Dict[int, float], np.ndarray],
     total_simulation_time: float = 1000.0,
     arrival_distribution: str = "uniform",
     seed: int = 42
@@ -29,8 +29,9 @@ def convert_taillard_to_staggered_arrivals(
     a lo largo del tiempo de simulación, manteniendo operaciones y due_dates originales.
     
     Args:
-        jobs_data: Lista de jobs Taillard [(machine, duration), ...]
-        due_dates: Diccionario {job_id: due_date}
+        jobs_data: Lista de jobs Taillard [(machine, duration), ...] o array
+            (num_jobs, num_machines, 2) de load_taillard_file_array
+        due_dates: Diccionario {job_id: due_date} o array (num_jobs,)
         total_simulation_time: Tiempo total de la simulación
         arrival_distribution: "uniform" (distribuye uniformemente) o "poisson" (proceso Poisson)
         seed: Seed para reproducibilidad
@@ -38,10 +39,10 @@ def convert_taillard_to_staggered_arrivals(
     Returns:
         Lista de JobSpec con arrival_time distribuidos
     """
-    np.random.seed(seed)
+    # Generador propio: no altera el estado global de numpy
+    rng = np.random.default_rng(seed)
     
     num_jobs = len(jobs_data)
-    arrival_times = []
     
     if arrival_distribution == "uniform":
         # Distribuir uniformemente los jobs a lo largo de la simulación
@@ -49,16 +50,25 @@ def convert_taillard_to_staggered_arrivals(
     elif arrival_distribution == "poisson":
         # Proceso Poisson: inter-arrival times exponenciales
         lambda_rate = num_jobs / (total_simulation_time * 0.8)
-        inter_arrivals = np.random.exponential(1.0 / lambda_rate, num_jobs)
+        inter_arrivals = rng.exponential(1.0 / lambda_rate, num_jobs)
         arrival_times = np.cumsum(inter_arrivals)
-        # Recortar si algunos llegan después del final
-        arrival_times = [t for t in arrival_times if t < total_simulation_time]
-        # Rellenar si faltan (ajustar número de jobs)
-        while len(arrival_times) < num_jobs:
-            arrival_times.append(arrival_times[-1] + 10.0)
-        arrival_times = arrival_times[:num_jobs]
+        # Recortar los que llegan después del final (prefijo, la suma es creciente)
+        valid = arrival_times[arrival_times < total_simulation_time]
+        # Rellenar si faltan, cada 10 u.t. tras la última llegada válida
+        missing = num_jobs - valid.size
+        if missing:
+            last = valid[-1] if valid.size else 0.0
+            valid = np.concatenate([valid, last + 10.0 * np.arange(1, missing + 1)])
+        arrival_times = valid
     else:
         raise ValueError(f"Distribución desconocida: {arrival_distribution}")
+    arrival_times = arrival_times.tolist()
+    
+    # Formato columnar: operaciones como tuplas de ints y due dates por índice
+    if isinstance(jobs_data, np.ndarray):
+        jobs_data = [tuple(map(tuple, ops)) for ops in jobs_data.tolist()]
+    if isinstance(due_dates, np.ndarray):
+        due_dates = dict(enumerate(due_dates.tolist()))
     
     jobs = []
     for jid, (arrival_time, operations) in enumerate(zip(arrival_times, jobs_data)):
@@ -70,7 +80,7 @@ def convert_taillard_to_staggered_arrivals(
         job = JobSpec(
             job_id=jid,
             arrival_time=arrival_time,
-            operations=operations,
+            operations=tuple(operations),
             due_date=adjusted_due
         )
         jobs.append(job)
@@ -3,6 +3,9 @@ Parser para archivos de instancias Job-Shop en formato OR-Library / Taillard.
 
 Funciones:
   - load_taillard_file(path, instance_name=None, instance_index=1, due_date_multiplier=1.5)
+  - load_taillard_array(path, instance_name=None, instance_index=1)
+  - load_taillard_file_array(path, instance_name=None, instance_index=1, due_date_multiplier=1.5)
+  - iter_taillard_instances(path, due_date_multiplier=1.5)
 
 El parser busca bloques que empiezan con la palabra "instance <name>" y a
 continuación una línea con "<num_jobs> <num_machines>" y luego una línea por
@@ -10,7 +13,18 @@ trabajo con pares "machine duration".
 
 Las máquinas en los archivos Taillard están indexadas desde 0.
 """
-from typing import List, Tuple, Dict, Optional
+import contextlib
+import functools
+import mmap
+import os
+import re
+from typing import Iterator, List, Tuple, Dict, Optional, Union
+
+import numpy as np
+
+
+# Cabecera de bloque: línea que empieza con "instance <name>" (sobre bytes)
+_INSTANCE_RE = re.compile(rb'^[ \t]*instance[ \t]+(\S+)', re.IGNORECASE | re.MULTILINE)
 
 
 def _iter_nonempty_lines(lines):
@@ -24,70 +38,107 @@ def _iter_nonempty_lines(lines):
         yield line
 
 
-def load_taillard_file(path: str,
-                       instance_name: Optional[str] = None,
-                       instance_index: int = 1,
-                       due_date_multiplier: float = 1.5) -> Tuple[List[List[Tuple[int, int]]], Dict[int, float]]:
-    """
-    Carga una instancia Taillard desde un archivo que puede contener varias.
-
-    Args:
-        path: Ruta al archivo que contiene una o más instancias.
-        instance_name: Nombre textual de la instancia (p.ej. 'ta01' o 'abz5'). Si se
-                       proporciona, se busca el bloque con ese nombre.
-        instance_index: Si no se proporciona `instance_name`, se toma la enésima
-                        instancia encontrada (1-based).
-        due_date_multiplier: multiplicador para estimar due dates a partir del
-                             procesamiento total del job.
-
-    Returns:
-        jobs_data: Lista de trabajos; cada trabajo es lista de tuplas (machine_id, duration)
-        due_dates: Diccionario job_id -> due_date estimado
-    """
-    import os
-
-    # Resolver rutas relativas respecto al paquete twin_scheduler_simpy
+def _resolve_path(path: str) -> str:
+    """Resuelve rutas relativas respecto al paquete twin_scheduler_simpy."""
     if not os.path.isabs(path) and not os.path.exists(path):
         base = os.path.dirname(__file__)
         candidate = os.path.join(base, path)
         if os.path.exists(candidate):
             path = candidate
+    return os.path.abspath(path)
 
-    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-        raw_lines = f.readlines()
 
-    # Localizar bloques 'instance <name>'
-    instances = []  # list of (name, start_line_index)
-    for i, raw in enumerate(raw_lines):
-        line = raw.strip()
-        if not line:
-            continue
-        parts = line.split()
-        if len(parts) >= 2 and parts[0].lower() == 'instance':
-            instances.append((parts[1], i))
-
-    if not instances:
-        # Si no aparecen 'instance', intentar parsear desde el inicio
-        start_idx = 0
-        chosen_idx = 0
-    else:
-        if instance_name:
-            # buscar por nombre (case-insensitive)
-            match = [idx for idx, (name, pos) in enumerate(instances) if name.lower() == instance_name.lower()]
-            if not match:
-                raise ValueError(f"Instancia '{instance_name}' no encontrada en {path}")
-            chosen = match[0]
+@contextlib.contextmanager
+def _mapped(path: str):
+    """Contenido del archivo mapeado en memoria (b'' si está vacío: mmap no admite tamaño 0)."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mm
+        finally:
+            mm.close()
+
+
+def _scan_instances(data) -> List[Tuple[str, int]]:
+    """Cabeceras 'instance <name>' del archivo como (name, offset)."""
+    return [(m.group(1).decode('utf-8', errors='ignore'), m.start())
+            for m in _INSTANCE_RE.finditer(data)]
+
+
+def _block_lines(data, start: int, end: int) -> List[str]:
+    """Decodifica a líneas solo el rango de bytes [start, end) del archivo."""
+    return data[start:end].decode('utf-8', errors='ignore').split('\n')
+
+
+def _parse_instance(path: str,
+                    instance_name: Optional[str] = None,
+                    instance_index: int = 1) -> Union[np.ndarray, Tuple[Tuple[Tuple[int, int], ...], ...]]:
+    """
+    Parsea los trabajos de una instancia, reutilizando el resultado si el
+    archivo no cambió desde la última lectura en este proceso.
+
+    Returns:
+        Array int32 de solo lectura (num_jobs, num_machines, 2) con pares
+        (machine, duration) si el bloque es rectangular (caso normal); si no,
+        los trabajos del parser línea a línea como tuplas.
+    """
+    path = _resolve_path(path)
+
+    # Los nombres de instancia se comparan sin distinguir mayúsculas
+    instance_key = ('name', instance_name.lower()) if instance_name else ('idx', instance_index)
+    return _parse_instance_cached(path, os.path.getmtime(path), instance_key)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_instance_cached(path: str, mtime: float, instance_key: Tuple[str, Union[str, int]]):
+    """Parseo real de _parse_instance; mtime invalida la caché si el archivo cambia."""
+    kind, value = instance_key
+    instance_name = value if kind == 'name' else None
+    instance_index = value if kind == 'idx' else 1
+
+    # El archivo se mapea en memoria: la regex recorre los bytes sin copiarlos
+    # y solo se decodifica a líneas el bloque de la instancia elegida
+    with _mapped(path) as data:
+        # Localizar bloques 'instance <name>' con una sola pasada de regex
+        instances = _scan_instances(data)  # list of (name, start_offset)
+
+        if not instances:
+            # Si no aparecen 'instance', intentar parsear desde el inicio
+            raw_lines = _block_lines(data, 0, len(data))
+            first_idx = 0
         else:
-            if instance_index < 1 or instance_index > len(instances):
-                raise IndexError(f"instance_index fuera de rango (1..{len(instances)})")
-            chosen = instance_index - 1
+            if instance_name:
+                # buscar por nombre (case-insensitive)
+                match = [idx for idx, (name, pos) in enumerate(instances) if name.lower() == instance_name.lower()]
+                if not match:
+                    raise ValueError(f"Instancia '{instance_name}' no encontrada en {path}")
+                chosen = match[0]
+            else:
+                if instance_index < 1 or instance_index > len(instances):
+                    raise IndexError(f"instance_index fuera de rango (1..{len(instances)})")
+                chosen = instance_index - 1
+
+            # El bloque va hasta la cabecera de la siguiente instancia
+            start = instances[chosen][1]
+            end = instances[chosen + 1][1] if chosen + 1 < len(instances) else len(data)
+            raw_lines = _block_lines(data, start, end)
+            first_idx = 1  # saltar la línea 'instance <name>'
 
-        _, start_idx = instances[chosen]
+    return _parse_block(raw_lines, first_idx, path)
 
+
+def _parse_block(raw_lines: List[str], first_idx: int,
+                 path: str) -> Union[np.ndarray, Tuple[Tuple[Tuple[int, int], ...], ...]]:
+    """
+    Parsea los trabajos de un bloque de instancia ya decodificado, buscando la
+    línea 'num_jobs num_machines' desde first_idx (ver _parse_instance).
+    """
     # Avanzar al siguiente renglón que contenga los números (jobs machines)
-    it = iter(raw_lines[start_idx+1:])
-    for line in it:
-        s = line.strip()
+    for header_idx in range(first_idx, len(raw_lines)):
+        s = raw_lines[header_idx].strip()
         if not s:
             continue
         if s.startswith('+'):
@@ -101,57 +152,150 @@ def load_taillard_file(path: str,
     else:
         raise ValueError("No se encontró la linea 'num_jobs num_machines' tras la instancia")
 
-    jobs = []
-    # Leer las próximas num_jobs líneas con pares máquina-duración
-    read = 0
-    for line in it:
+    # Camino rápido: las num_jobs líneas siguientes se convierten en una sola
+    # pasada de NumPy; si el total de enteros no cuadra con un bloque
+    # rectangular, se recurre al parser línea a línea
+    job_lines = []
+    for line in raw_lines[header_idx+1:]:
         s = line.strip()
-        if not s:
-            continue
-        if s.startswith('+'):
-            continue
-        tokens = s.split()
-        # En algunos ficheros existen líneas muy largas; los jobs pueden estar
-        # en una sola línea o partirse; asumimos que cada job se representa en una sola línea.
-        if len(tokens) < 2:
+        if not s or s.startswith('+') or len(s.split(None, 1)) < 2:
             continue
-        # Parsear pares
-        pairs = []
-        nums = [int(t) for t in tokens]
-        if len(nums) % 2 != 0:
-            # Si la línea no tiene pares completos, intentar leer la siguiente y concatenar
-            # (muy raro pero por seguridad)
-            extra = []
-            while len(nums) % 2 != 0:
-                try:
-                    extra_line = next(it)
-                except StopIteration:
-                    break
-                extra_tokens = extra_line.strip().split()
-                extra += [int(t) for t in extra_tokens if t.isdigit()]
-                nums += extra
-
-        for j in range(0, len(nums), 2):
-            machine = nums[j]
-            duration = nums[j+1]
-            pairs.append((machine, duration))
-
-        # Si la línea contiene más pares de los esperados, recortamos al número de máquinas
-        if len(pairs) > num_machines:
-            pairs = pairs[:num_machines]
-
-        jobs.append(pairs)
-        read += 1
-        if read >= num_jobs:
+        job_lines.append(s)
+        if len(job_lines) >= num_jobs:
             break
+    if len(job_lines) == num_jobs:
+        nums = np.fromstring(" ".join(job_lines), dtype=np.int32, sep=" ")
+        if nums.size == num_jobs * num_machines * 2:
+            ops = nums.reshape(num_jobs, num_machines, 2)
+            # Compartido entre llamadas: de solo lectura
+            ops.flags.writeable = False
+            return ops
+
+    # Camino lento (bloques no rectangulares): un job por línea, reutilizando
+    # las líneas ya filtradas; las líneas con más pares de los esperados se
+    # recortan al número de máquinas
+    jobs = []
+    for s in job_lines:
+        nums = [int(t) for t in s.split()]
+        if len(nums) % 2 != 0:
+            raise ValueError(f"Línea de job con pares incompletos en {path}: '{s}'")
+        pairs = list(zip(nums[0::2], nums[1::2]))
+        jobs.append(pairs[:num_machines])
 
     if len(jobs) != num_jobs:
         raise ValueError(f"Esperaba {num_jobs} jobs pero parseé {len(jobs)} en {path}")
 
-    # Estimar due_dates
-    due_dates = {}
-    for jid, ops in enumerate(jobs):
-        total = sum(d for _, d in ops)
-        due_dates[jid] = total * due_date_multiplier  # arrival_time assumed 0
+    return tuple(tuple(ops) for ops in jobs)
+
+
+def load_taillard_file(path: str,
+                       instance_name: Optional[str] = None,
+                       instance_index: int = 1,
+                       due_date_multiplier: float = 1.5) -> Tuple[List[List[Tuple[int, int]]], Dict[int, float]]:
+    """
+    Carga una instancia Taillard desde un archivo que puede contener varias.
+
+    Args:
+        path: Ruta al archivo que contiene una o más instancias.
+        instance_name: Nombre textual de la instancia (p.ej. 'ta01' o 'abz5'). Si se
+                       proporciona, se busca el bloque con ese nombre.
+        instance_index: Si no se proporciona `instance_name`, se toma la enésima
+                        instancia encontrada (1-based).
+        due_date_multiplier: multiplicador para estimar due dates a partir del
+                             procesamiento total del job.
+
+    Returns:
+        jobs_data: Lista de trabajos; cada trabajo es lista de tuplas (machine_id, duration)
+        due_dates: Diccionario job_id -> due_date estimado
+    """
+    parsed = _parse_instance(path, instance_name, instance_index)
+    return _to_jobs(parsed, due_date_multiplier)
+
+
+def _to_jobs(parsed: Union[np.ndarray, Tuple], due_date_multiplier: float) -> Tuple[List[List[Tuple[int, int]]], Dict[int, float]]:
+    """Convierte el resultado del parser al formato de load_taillard_file."""
+    if isinstance(parsed, np.ndarray):
+        # Vista de compatibilidad (lista de tuplas) sobre el array
+        jobs = [list(map(tuple, row)) for row in parsed.tolist()]
+        # Acumulador int64 explícito (en algunas plataformas el de int32 es int32)
+        totals = parsed[:, :, 1].sum(axis=1, dtype=np.int64)
+    else:
+        jobs = [list(ops) for ops in parsed]
+        totals = np.array([sum(d for _, d in ops) for ops in jobs], dtype=np.int64)
+
+    # Estimar due_dates (arrival_time assumed 0)
+    due_dates = dict(enumerate((totals * due_date_multiplier).tolist()))
 
     return jobs, due_dates
+
+
+def load_taillard_array(path: str,
+                        instance_name: Optional[str] = None,
+                        instance_index: int = 1) -> np.ndarray:
+    """
+    Carga una instancia Taillard como array (num_jobs, num_machines, 2) de
+    pares (machine_id, duration), sin construir la lista de tuplas. El array
+    se comparte entre llamadas y es de solo lectura (usar .copy() para editarlo).
+
+    Args:
+        path, instance_name, instance_index: Igual que en load_taillard_file.
+
+    Raises:
+        ValueError: Si los trabajos no tienen todos num_machines operaciones.
+    """
+    parsed = _parse_instance(path, instance_name, instance_index)
+    if isinstance(parsed, np.ndarray):
+        return parsed
+    lengths = {len(ops) for ops in parsed}
+    if len(lengths) != 1:
+        raise ValueError(f"La instancia de {path} no es rectangular (operaciones por job: {sorted(lengths)})")
+    return np.array(parsed, dtype=np.int32)
+
+
+def load_taillard_file_array(path: str,
+                             instance_name: Optional[str] = None,
+                             instance_index: int = 1,
+                             due_date_multiplier: float = 1.5) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Variante de load_taillard_file en formato columnar.
+
+    Returns:
+        ops: Array int32 (num_jobs, num_machines, 2) de pares (machine_id, duration)
+        due_dates: Array float64 (num_jobs,) con el due date estimado de cada job
+    """
+    ops = load_taillard_array(path, instance_name, instance_index)
+    due_dates = ops[:, :, 1].sum(axis=1, dtype=np.int64) * due_date_multiplier
+    return ops, due_dates
+
+
+def iter_taillard_instances(path: str,
+                            due_date_multiplier: float = 1.5) -> Iterator[Tuple[str, List[List[Tuple[int, int]]], Dict[int, float]]]:
+    """
+    Recorre las instancias de un archivo en orden, parseando cada bloque solo
+    cuando se pide (usar itertools.islice o cortar el bucle para no parsear el
+    resto del archivo). El archivo se lee y se cierra en el primer next().
+
+    Args:
+        path: Ruta al archivo que contiene una o más instancias.
+        due_date_multiplier: Igual que en load_taillard_file.
+
+    Yields:
+        (name, jobs_data, due_dates) por instancia, con jobs_data y due_dates
+        en el formato de load_taillard_file. Si el archivo no tiene
+        cabeceras 'instance', se produce una única instancia con el nombre
+        del archivo.
+    """
+    path = _resolve_path(path)
+    # Copiar los bloques a bytes y cerrar el mapeo antes de ceder el control:
+    # un generador abandonado a medias no deja el archivo abierto
+    with _mapped(path) as data:
+        instances = _scan_instances(data)
+        if instances:
+            ends = [start for _, start in instances[1:]] + [len(data)]
+            blocks = [(name, data[start:end], 1) for (name, start), end in zip(instances, ends)]
+        else:
+            name = os.path.splitext(os.path.basename(path))[0]
+            blocks = [(name, data[:], 0)]
+    for name, block, first_idx in blocks:
+        parsed = _parse_block(_block_lines(block, 0, len(block)), first_idx, path)
+        yield (name, *_to_jobs(parsed, due_date_multiplier))
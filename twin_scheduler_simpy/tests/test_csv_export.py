@@ -0,0 +1,56 @@
+"""write_csv: mismo formato que el export por filas previo, sea cual sea la entrada."""
+import numpy as np
+import pandas as pd
+
+from twin_scheduler_simpy.csv_export import write_csv
+
+
+def _table():
+    table = np.zeros(3, dtype=[('job_id', 'i4'), ('machine', 'U8'), ('start', 'f8'), ('end', 'f8')])
+    table['job_id'] = [0, 1, 2]
+    table['machine'] = ['M0', 'M1', 'M0']
+    table['start'] = [0.0, 0.1, 5.0]
+    table['end'] = [1.5, 1e20, 12.3456789]
+    return table
+
+
+def test_structured_and_dict_inputs_write_identical_bytes(tmp_path):
+    table = _table()
+    structured = tmp_path / "structured.csv"
+    columns = tmp_path / "columns.csv"
+
+    write_csv(table, str(structured))
+    write_csv({name: table[name] for name in table.dtype.names}, str(columns))
+
+    assert structured.read_bytes() == columns.read_bytes()
+
+
+def _jobs_table():
+    """Tabla de trabajos de la Fase 3 en columnas NumPy (ids y operaciones enteros cortos)."""
+    return {
+        'job_id': np.array([0, 1, 3], dtype=np.int32),
+        'arrival_time': np.array([0.0, 2.5, 7.123456789], dtype=np.float64),
+        'due_date': np.array([30.0, 41.25, 60.1], dtype=np.float64),
+        'completion_time': np.array([12.0, 44.75, 100.0], dtype=np.float64),
+        'tardiness': np.array([0.0, 3.5, 39.9], dtype=np.float64),
+        'num_operations': np.array([3, 5, 2], dtype=np.int16),
+    }
+
+
+def test_columnar_jobs_table_matches_row_wise_export(tmp_path):
+    """Mismo CSV que el export previo (lista de dicts con valores de Python)."""
+    columns = _jobs_table()
+    out = tmp_path / "out.csv"
+    baseline = tmp_path / "baseline.csv"
+
+    write_csv(columns, str(out))
+    rows = [dict(zip(columns, values)) for values in zip(*(col.tolist() for col in columns.values()))]
+    pd.DataFrame(rows).to_csv(baseline, index=False)
+
+    assert out.read_bytes() == baseline.read_bytes()
+    assert out.read_text().splitlines() == [
+        "job_id,arrival_time,due_date,completion_time,tardiness,num_operations",
+        "0,0.0,30.0,12.0,0.0,3",
+        "1,2.5,41.25,44.75,3.5,5",
+        "3,7.123456789,60.1,100.0,39.9,2",
+    ]
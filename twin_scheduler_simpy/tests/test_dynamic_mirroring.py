@@ -0,0 +1,51 @@
+"""Mirroring del simulador dinámico: ningún evento queda sin enviar a JADE."""
+import simpy
+
+from twin_scheduler_simpy import simulator_dynamic
+from twin_scheduler_simpy.simulator_dynamic import DynamicJobShopSimulator
+
+
+class _RecordingClient:
+    """Cliente JADE falso: registra los lotes de eventos enviados."""
+
+    def __init__(self):
+        self.events = []
+
+    def notify_events_batch(self, events):
+        self.events.extend(events)
+
+
+def _mirroring_simulator(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    client = _RecordingClient()
+    monkeypatch.setattr(simulator_dynamic, "_load_jade_client", lambda: client)
+    env = simpy.Environment()
+    sim = DynamicJobShopSimulator(env, 4, arrival_rate=0.5, scheduling_rule="SPT",
+                                  random_seed=42, training=False, mirroring=True,
+                                  mirror_flush_dt=10.0)
+    return env, sim, client
+
+
+def test_flush_mirror_sends_final_partial_batch(monkeypatch, tmp_path):
+    env, sim, client = _mirroring_simulator(monkeypatch, tmp_path)
+
+    # Como run_mirroring.py: env.run directo, cortando entre dos vaciados periódicos
+    env.run(until=25)
+    pending = len(sim._mirror_buffer)
+    sent = len(client.events)
+    sim.flush_mirror()
+
+    assert pending > 0
+    assert sim._mirror_buffer == []
+    assert len(client.events) == sent + pending
+    times = [event['time'] for event in client.events]
+    assert times == sorted(times)
+
+
+def test_run_leaves_no_pending_mirror_events(monkeypatch, tmp_path):
+    env, sim, client = _mirroring_simulator(monkeypatch, tmp_path)
+
+    sim.run(until_time=25, warmup=0)
+
+    assert sim._mirror_buffer == []
+    assert client.events
@@ -0,0 +1,35 @@
+"""reset(seed) deja el simulador dinámico como uno recién construido."""
+import random
+
+import simpy
+
+from twin_scheduler_simpy.simulator_dynamic import DynamicJobShopSimulator
+
+
+def _simulator(seed):
+    return DynamicJobShopSimulator(simpy.Environment(), 4, arrival_rate=0.4, mtbf=100, mttr=8,
+                                   scheduling_rule="SPT", random_seed=seed, training=False)
+
+
+def _episode(sim):
+    # ArrivalGenerator usa además el módulo random (no lo siembra el simulador)
+    random.seed(0)
+    sim.run(until_time=300, warmup=10)
+    return sim.jobs_table.tolist(), sim.failure_manager.failure_table.tolist()
+
+
+def test_reset_matches_fresh_simulator(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    reused = _simulator(seed=1)
+    first = _episode(reused)
+    random.seed(0)
+    reused.reset(seed=7)
+    after_reset = _episode(reused)
+
+    random.seed(0)
+    fresh = _episode(_simulator(seed=7))
+
+    assert after_reset[0], "el episodio no completó trabajos"
+    assert after_reset == fresh
+    assert after_reset != first
@@ -0,0 +1,49 @@
+"""Asignación CNP en la Fase 3: cada operación se negocia salvo caché explícita."""
+import simpy
+
+from twin_scheduler_simpy.simulator_phase3_cnp import CNPJobShopSimulator
+
+
+class _LeastLoadedClient:
+    """Cliente CNP falso: elige la máquina disponible con menos carga actual."""
+
+    def __init__(self, sim):
+        self.sim = sim
+        self.calls = 0
+
+    def request_machine_assignment(self, job_id, operation_index, current_time, available_machines):
+        self.calls += 1
+        machines = self.sim.machines
+        load = lambda m: machines[m].resource.count + len(machines[m].resource.queue)
+        return {'machine_id': min(available_machines, key=load)}
+
+
+def _simulator(**kwargs):
+    env = simpy.Environment()
+    sim = CNPJobShopSimulator(env, num_machines=2, **kwargs)
+    client = _LeastLoadedClient(sim)
+    sim.cnp_client = client
+    return env, sim, client
+
+
+def test_back_to_back_requests_with_different_loads_negotiate():
+    env, sim, client = _simulator()
+
+    first = sim._pick_machine(job_id=0, op_index=0, machine_type=0, available_machines=[0, 1])
+    # La máquina elegida queda ocupada antes de la siguiente solicitud
+    sim.machines[first].resource.request()
+    env.run(until=1)
+    second = sim._pick_machine(job_id=1, op_index=0, machine_type=0, available_machines=[0, 1])
+
+    assert client.calls == 2
+    assert second != first
+
+
+def test_assignment_cache_is_opt_in():
+    env, sim, client = _simulator(assignment_cache_ttl=5.0)
+
+    first = sim._pick_machine(job_id=0, op_index=0, machine_type=0, available_machines=[0, 1])
+    second = sim._pick_machine(job_id=1, op_index=0, machine_type=0, available_machines=[0, 1])
+
+    assert client.calls == 1
+    assert second == first
@@ -0,0 +1,26 @@
+"""Log de eventos del simulador estático (EventBuffer) y su exportación."""
+import glob
+
+from twin_scheduler_simpy.datasets import Datasets
+from twin_scheduler_simpy.metrics import EventBuffer
+from twin_scheduler_simpy.simulator_static import run_simulation
+
+
+def test_log_rows_and_csv_keep_integer_times(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    jobs, due = Datasets.load_dataset("FT06")
+
+    result = run_simulation(jobs, due, rule="SPT", verbose=False, export_log=True, show_schedule=False)
+
+    log = result["log"]
+    assert isinstance(log, EventBuffer)
+    rows = log.to_rows(integer_times=True)
+    assert len(rows) == 2 * sum(len(ops) for ops in jobs)
+    assert all(type(time) is int for time, _, _, _ in rows)
+    assert {event for _, event, _, _ in rows} == {"start", "finish"}
+    assert EventBuffer.from_rows(rows).to_rows(integer_times=True) == rows
+
+    (csv_file,) = glob.glob(str(tmp_path / "simulation_log_SPT_*.csv"))
+    lines = open(csv_file).read().splitlines()
+    assert lines[0] == "time,event,job,machine"
+    assert lines[1:] == [",".join(map(str, row)) for row in rows]
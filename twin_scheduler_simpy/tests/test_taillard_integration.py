@@ -0,0 +1,25 @@
+"""Llegadas escalonadas desde instancias Taillard en formato lista o columnar."""
+import os
+
+import pytest
+
+from twin_scheduler_simpy import taillard_loader
+from twin_scheduler_simpy.taillard_integration import convert_taillard_to_staggered_arrivals
+from twin_scheduler_simpy.taillard_loader import load_taillard_file, load_taillard_file_array
+
+JOBSHOP1 = os.path.join(os.path.dirname(taillard_loader.__file__), "datasets", "jobshop1.txt")
+
+
+@pytest.mark.parametrize("distribution", ["uniform", "poisson"])
+def test_array_path_yields_same_job_specs(distribution):
+    jobs, due = load_taillard_file(JOBSHOP1, instance_index=1)
+    ops, due_array = load_taillard_file_array(JOBSHOP1, instance_index=1)
+
+    from_lists = convert_taillard_to_staggered_arrivals(jobs, due, arrival_distribution=distribution, seed=7)
+    from_arrays = convert_taillard_to_staggered_arrivals(ops, due_array, arrival_distribution=distribution, seed=7)
+
+    assert from_arrays == from_lists
+    # Operaciones con ints de Python, no escalares NumPy
+    machine, duration = from_arrays[0].operations[0]
+    assert type(machine) is int and type(duration) is int
+    assert type(from_arrays[0].due_date) is float
@@ -2,12 +2,14 @@
 """
 from twin_scheduler_simpy.datasets import Datasets
 from twin_scheduler_simpy.simulator_static import run_simulation
+from twin_scheduler_simpy.utils.profile import phase
 
 
 def main():
     path_key = "TA:datasets/jobshop1.txt:1"
     print(f"Cargando dataset {path_key}...")
-    jobs, due = Datasets.load_dataset(path_key)
+    with phase("parse"):
+        jobs, due = Datasets.load_dataset(path_key)
     print(f"Jobs cargados: {len(jobs)}, máquinas (estimadas): {len({m for job in jobs for m,_ in job})}")
 
     print("Ejecutando simulador estático (verbose=False, export_log=False)...")
@@ -0,0 +1,65 @@
+"""Parser de instancias Taillard (taillard_loader)."""
+import contextlib
+import itertools
+import os
+
+import numpy as np
+import pytest
+
+from twin_scheduler_simpy import taillard_loader
+from twin_scheduler_simpy.taillard_loader import iter_taillard_instances, load_taillard_file
+
+JOBSHOP1 = os.path.join(os.path.dirname(taillard_loader.__file__), "datasets", "jobshop1.txt")
+
+
+def test_iter_instances_matches_load_by_index():
+    for index, (name, jobs, due) in enumerate(itertools.islice(iter_taillard_instances(JOBSHOP1), 3), start=1):
+        assert (jobs, due) == load_taillard_file(JOBSHOP1, instance_index=index)
+        assert (jobs, due) == load_taillard_file(JOBSHOP1, instance_name=name)
+
+
+def test_iter_instances_closes_file_before_yielding(monkeypatch):
+    state = {'open': 0}
+    mapped = taillard_loader._mapped
+
+    @contextlib.contextmanager
+    def tracked(path):
+        state['open'] += 1
+        try:
+            with mapped(path) as data:
+                yield data
+        finally:
+            state['open'] -= 1
+
+    monkeypatch.setattr(taillard_loader, "_mapped", tracked)
+    instances = iter_taillard_instances(JOBSHOP1)
+    next(instances)
+    # Generador suspendido (y luego abandonado) sin archivo ni mapeo abiertos
+    assert state['open'] == 0
+    next(instances)
+    assert state['open'] == 0
+
+
+WELL_FORMED = ["instance t", " +++", " 3 2", " 0 3 1 4", " 1 2 0 5", " 0 7 1 1", " +++"]
+
+
+def test_parse_block_fast_path_matches_fallback(monkeypatch):
+    fast = taillard_loader._parse_block(WELL_FORMED, 1, "t.txt")
+    assert isinstance(fast, np.ndarray)
+
+    # Sin el camino rápido (conteo de enteros que no cuadra) se usa el parser línea a línea
+    monkeypatch.setattr(np, "fromstring", lambda *args, **kwargs: np.empty(0, dtype=np.int32))
+    slow = taillard_loader._parse_block(WELL_FORMED, 1, "t.txt")
+
+    assert isinstance(slow, tuple)
+    assert slow == tuple(tuple(map(tuple, ops)) for ops in fast.tolist())
+
+
+@pytest.mark.parametrize("lines", [
+    ["instance t", " 2 2", " 0 3 1", " 1 2 0 5"],          # pares incompletos
+    ["instance t", " 3 2", " 0 3 1 4", " 1 2 0 5"],        # faltan jobs
+    ["instance t", " +++", " sin cabecera"],               # sin 'num_jobs num_machines'
+])
+def test_parse_block_rejects_malformed_block(lines):
+    with pytest.raises(ValueError):
+        taillard_loader._parse_block(lines, 1, "t.txt")
@@ -0,0 +1 @@
+"""Utilidades comunes del simulador."""
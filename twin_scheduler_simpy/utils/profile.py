@@ -0,0 +1,57 @@
+"""
+Perfilado ligero por fases (parseo, simulación, métricas, exportación).
+
+Desactivado salvo MARL_PROFILE=1: en ese caso cada `with phase(nombre)`
+acumula el tiempo de pared de la fase y al terminar el proceso se imprime
+un resumen. Sin la variable, `phase` no mide nada.
+"""
+
+import atexit
+import contextlib
+import os
+import time
+from collections import defaultdict
+from typing import Dict
+
+ENABLED = bool(int(os.environ.get("MARL_PROFILE", "0")))
+
+# Tiempo acumulado (ns) y número de llamadas por fase
+_phases: Dict[str, int] = defaultdict(int)
+_calls: Dict[str, int] = defaultdict(int)
+
+
+@contextlib.contextmanager
+def phase(name: str):
+    """Mide el tiempo de pared del bloque y lo acumula en la fase `name`."""
+    if not ENABLED:
+        yield
+        return
+    t = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        _phases[name] += time.perf_counter_ns() - t
+        _calls[name] += 1
+
+
+def report():
+    """Imprime el tiempo acumulado por fase, de mayor a menor."""
+    if not _phases:
+        return
+    total = sum(_phases.values())
+    print(f"\n{'='*70}")
+    print("[PROFILE] TIEMPO POR FASE")
+    print(f"{'='*70}")
+    for name, ns in sorted(_phases.items(), key=lambda kv: kv[1], reverse=True):
+        print(f"  {name:<12} {ns / 1e6:10.2f} ms  {100 * ns / total:5.1f}%  ({_calls[name]} llamadas)")
+    print(f"{'='*70}\n")
+
+
+def reset():
+    """Descarta los tiempos acumulados."""
+    _phases.clear()
+    _calls.clear()
+
+
+if ENABLED:
+    atexit.register(report)